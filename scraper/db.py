@@ -7,14 +7,32 @@ from pathlib import Path
 
 DB_PATH = Path(__file__).resolve().parent.parent / "data" / "banglprop.db"
 
+# ids of connections whose schema is known to exist. sqlite3.Connection
+# accepts neither ad-hoc attributes nor weak references, so an id set is
+# the cheapest per-connection marker; the scraper holds one or two
+# long-lived connections per process, so id reuse is not a concern.
+_initialised_conns: set[int] = set()
+
 
 def get_connection() -> sqlite3.Connection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
+    # WAL + NORMAL sync: writers don't block the Next.js readers and commits
+    # don't pay a full fsync each; plenty durable for re-scrapeable data.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    init_schema(conn)
     return conn
 
 
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """O(1) set-membership guard replacing a 30-line executescript per insert."""
+    if id(conn) not in _initialised_conns:
+        init_schema(conn)
+
+
 def init_schema(conn: sqlite3.Connection) -> None:
     conn.executescript("""
     CREATE TABLE IF NOT EXISTS properties (
@@ -64,92 +82,143 @@ def init_schema(conn: sqlite3.Connection) -> None:
     CREATE INDEX IF NOT EXISTS idx_auctions_price ON auctions(price_lakhs);
     CREATE INDEX IF NOT EXISTS idx_auctions_bank ON auctions(bank_name);
     """)
+    _initialised_conns.add(id(conn))
+
+
+_INSERT_PROPERTY_SQL = """
+INSERT OR REPLACE INTO properties (
+    url, id, source, status, name, builder, locality,
+    price_min_lakhs, price_max_lakhs, price_display, handover, handover_year, bhk
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _clip(r: dict, key: str, limit: int | None = None):
+    """One-pass get/strip/truncate; empty values become NULL."""
+    v = r.get(key)
+    if v is None or v == "":
+        return None
+    if isinstance(v, str):
+        v = v.strip()
+        if limit:
+            v = v[:limit]
+    return v or None
+
+
+# (column, truncation limit) in INSERT column order; None = non-string or unclipped.
+_PROPERTY_FIELDS = (
+    ("url", None), ("id", None), ("source", None), ("status", None),
+    ("name", 200), ("builder", 100), ("locality", 150),
+    ("price_min_lakhs", None), ("price_max_lakhs", None), ("price_display", 80),
+    ("handover", 50), ("handover_year", None), ("bhk", 30),
+)
+
+_AUCTION_FIELDS = (
+    ("url", None), ("id", None), ("name", 250), ("description", 3000),
+    ("price_display", 80), ("price_lakhs", None), ("emd_display", 80), ("emd_lakhs", None),
+    ("sq_ft", 50), ("bank_name", 120), ("branch_name", 120),
+    ("contact", 100), ("contact_person", 80), ("contact_mobile", 20), ("address", 250),
+    ("auction_start", 50), ("auction_end", 50), ("auction_datetime", 50),
+    ("category", 50), ("source", None),
+)
+
+
+def _property_to_row(r: dict) -> tuple:
+    return tuple(_clip(r, key, limit) for key, limit in _PROPERTY_FIELDS)
 
 
 def insert_property(conn: sqlite3.Connection, r: dict) -> None:
-    init_schema(conn)
-    conn.execute("""
-    INSERT OR REPLACE INTO properties (
-        url, id, source, status, name, builder, locality,
-        price_min_lakhs, price_max_lakhs, price_display, handover, handover_year, bhk
-    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        (r.get("url") or "").strip() or None,
-        (r.get("id") or "").strip() or None,
-        (r.get("source") or "").strip() or None,
-        (r.get("status") or "").strip() or None,
-        (r.get("name") or "").strip()[:200] or None,
-        (r.get("builder") or "").strip()[:100] or None,
-        (r.get("locality") or "").strip()[:150] or None,
-        r.get("price_min_lakhs"),
-        r.get("price_max_lakhs"),
-        (r.get("price_display") or "").strip()[:80] or None,
-        (r.get("handover") or "").strip()[:50] or None,
-        r.get("handover_year"),
-        (r.get("bhk") or "").strip()[:30] or None,
-    ))
+    _ensure_schema(conn)
+    conn.execute(_INSERT_PROPERTY_SQL, _property_to_row(r))
     conn.commit()
 
 
-def update_property(conn: sqlite3.Connection, url: str, r: dict) -> None:
-    """Update existing property row by url with enriched fields."""
-    if not url:
+def insert_properties_bulk(conn: sqlite3.Connection, rows: list[dict]) -> None:
+    """Insert a batch of property records in one transaction (one fsync per batch)."""
+    if not rows:
         return
-    updates = []
+    with conn:
+        conn.executemany(_INSERT_PROPERTY_SQL, [_property_to_row(r) for r in rows])
+
+
+# Fixed COALESCE form so SQLite prepares the statement once instead of
+# reparsing a freshly concatenated SQL string per enriched row; absent
+# fields are passed as NULL and keep their current value.
+_UPDATE_PROPERTY_SQL = """
+UPDATE properties SET
+    name = COALESCE(?, name),
+    builder = COALESCE(?, builder),
+    locality = COALESCE(?, locality),
+    price_min_lakhs = COALESCE(?, price_min_lakhs),
+    price_max_lakhs = COALESCE(?, price_max_lakhs),
+    price_display = COALESCE(?, price_display),
+    handover = COALESCE(?, handover),
+    handover_year = COALESCE(?, handover_year),
+    bhk = COALESCE(?, bhk),
+    status = COALESCE(?, status),
+    updated_at = datetime('now')
+WHERE url = ?
+"""
+
+_UPDATE_LIMITS = {"name": 200, "builder": 100, "locality": 150}
+
+
+def _update_args(url: str, r: dict) -> tuple:
     args = []
     for key in ("name", "builder", "locality", "price_min_lakhs", "price_max_lakhs", "price_display",
-               "handover", "handover_year", "bhk", "status"):
-        if key in r and r[key] is not None and r[key] != "":
-            updates.append(f"{key} = ?")
-            val = r[key]
-            if key in ("name", "builder", "locality") and isinstance(val, str):
-                val = val[:200] if key == "name" else val[:100] if key == "builder" else val[:150]
-            args.append(val)
-    if not updates:
-        return
+                "handover", "handover_year", "bhk", "status"):
+        val = r.get(key)
+        if val is None or val == "":
+            args.append(None)
+            continue
+        limit = _UPDATE_LIMITS.get(key)
+        if limit and isinstance(val, str):
+            val = val[:limit]
+        args.append(val)
     args.append(url)
-    conn.execute(
-        "UPDATE properties SET " + ", ".join(updates) + ", updated_at = datetime('now') WHERE url = ?",
-        args
-    )
+    return tuple(args)
+
+
+def update_property(conn: sqlite3.Connection, url: str, r: dict) -> None:
+    """Update existing property row by url with enriched fields."""
+    if not url:
+        return
+    conn.execute(_UPDATE_PROPERTY_SQL, _update_args(url, r))
     conn.commit()
 
 
+def update_properties_bulk(conn: sqlite3.Connection, items: list[tuple[str, dict]]) -> None:
+    """Apply enrichment updates for (url, fields) pairs in one transaction."""
+    items = [(url, r) for url, r in items if url]
+    if not items:
+        return
+    with conn:
+        conn.executemany(_UPDATE_PROPERTY_SQL, [_update_args(url, r) for url, r in items])
+
+
 def get_property_urls_by_source(conn: sqlite3.Connection, source: str) -> list[str]:
     cur = conn.execute("SELECT url FROM properties WHERE source = ?", (source,))
     return [row[0] for row in cur.fetchall() if row[0]]
 
 
+def get_property_urls_grouped(conn: sqlite3.Connection) -> dict[str, list[str]]:
+    """All property urls keyed by source, collected in one table scan."""
+    grouped: dict[str, list[str]] = {}
+    for url, source in conn.execute("SELECT url, source FROM properties"):
+        if url:
+            grouped.setdefault(source or "", []).append(url)
+    return grouped
+
+
 def insert_auction(conn: sqlite3.Connection, r: dict) -> None:
-    init_schema(conn)
+    _ensure_schema(conn)
     conn.execute("""
     INSERT OR REPLACE INTO auctions (
         url, id, name, description, price_display, price_lakhs, emd_display, emd_lakhs,
         sq_ft, bank_name, branch_name, contact, contact_person, contact_mobile, address,
         auction_start, auction_end, auction_datetime, category, source
     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        (r.get("url") or "").strip() or None,
-        str(r.get("id") or "").strip() or None,
-        (r.get("name") or "").strip()[:250] or None,
-        (r.get("description") or "").strip()[:3000] or None,
-        (r.get("price_display") or "").strip()[:80] or None,
-        r.get("price_lakhs"),
-        (r.get("emd_display") or "").strip()[:80] or None,
-        r.get("emd_lakhs"),
-        (r.get("sq_ft") or "").strip()[:50] or None,
-        (r.get("bank_name") or "").strip()[:120] or None,
-        (r.get("branch_name") or "").strip()[:120] or None,
-        (r.get("contact") or "").strip()[:100] or None,
-        (r.get("contact_person") or "").strip()[:80] or None,
-        (r.get("contact_mobile") or "").strip()[:20] or None,
-        (r.get("address") or "").strip()[:250] or None,
-        (r.get("auction_start") or "").strip()[:50] or None,
-        (r.get("auction_end") or "").strip()[:50] or None,
-        (r.get("auction_datetime") or "").strip()[:50] or None,
-        (r.get("category") or "").strip()[:50] or None,
-        (r.get("source") or "").strip() or None,
-    ))
+    """, tuple(_clip(r, key, limit) for key, limit in _AUCTION_FIELDS))
     conn.commit()
 
 
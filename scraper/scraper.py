@@ -5,24 +5,52 @@ Stores each record in SQLite as soon as it's fetched (no large in-memory list).
 Optional: export to public/properties.json for legacy viewer.
 """
 
+import asyncio
+import atexit
+import functools
+import gzip
+import hashlib
+import json
+import os
 import re
 import sys
+import threading
 import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 # Allow running as python scraper/scraper.py from project root
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# C-backed lxml tree for the hot 99acres listing parse (anchors + ancestor walks in C)
+from lxml import html as lxml_html
+
+# Optional: aiohttp lets paginated listing fetches overlap (pages 2+ don't need JS rendering)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: orjson serializes the properties.json export in C (several times faster than json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from db import (
     get_connection,
-    get_property_urls_by_source,
+    get_property_urls_grouped,
     init_schema,
+    insert_properties_bulk,
     insert_property,
     property_row_to_dict,
+    update_properties_bulk,
     update_property,
 )
 
@@ -34,11 +62,104 @@ REQUEST_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 REQUEST_DELAY_SEC = 2  # be polite to the server
+PAGE_FETCH_CONCURRENCY = 4  # max in-flight pagination requests per batch
 # Timeout per request so we don't hang indefinitely (retries still happen)
 REQUEST_TIMEOUT = 60  # seconds (connect + read)
 RETRY_ATTEMPTS = 3
 RETRY_BACKOFF_SEC = 5  # double after each attempt
 
+# One session for all requests-based fetches: keep-alive + pooled connections
+# avoid a fresh TCP/TLS handshake per page against the same two hosts.
+# Transient connect/read errors and throttling responses retry inside
+# urllib3 with a short backoff, so single-shot fetchers (the detail paths)
+# survive blips without their own retry loops.
+_SESSION = requests.Session()
+_SESSION.headers.update(REQUEST_HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+
+def get_session() -> requests.Session:
+    """The shared pooled session (exposed so callers can tweak adapters/proxies)."""
+    return _SESSION
+
+
+# On-disk HTML cache so repeated runs (and Playwright cold starts) are skipped
+# for pages fetched within the TTL. gzip keeps thousands of detail pages small.
+_CACHE_DIR = Path(__file__).resolve().parent / ".scrape_cache"
+HTML_CACHE_TTL_SEC = 86400
+
+
+def _cache_get(url: str, ttl_seconds: int = HTML_CACHE_TTL_SEC) -> str | None:
+    key = hashlib.sha1(url.encode()).hexdigest()
+    meta_path = _CACHE_DIR / f"{key}.meta.json"
+    try:
+        meta = json.loads(meta_path.read_text())
+        if time.time() - meta["fetched_at"] >= ttl_seconds:
+            return None
+        return gzip.decompress((_CACHE_DIR / f"{key}.html.gz").read_bytes()).decode("utf-8")
+    except Exception:
+        return None
+
+
+def _cache_put(url: str, html: str) -> None:
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        key = hashlib.sha1(url.encode()).hexdigest()
+        (_CACHE_DIR / f"{key}.html.gz").write_bytes(gzip.compress(html.encode("utf-8")))
+        (_CACHE_DIR / f"{key}.meta.json").write_text(
+            json.dumps({"url": url, "fetched_at": time.time()})
+        )
+    except Exception:
+        pass  # cache is best-effort; never fail a fetch over it
+
+
+# Bump whenever listing-parse logic changes (price/possession/slug handling),
+# so stale parsed-record cache entries are ignored.
+PARSER_VERSION = 1
+
+
+def _parsed_cache_load(page_url: str, html_digest: str) -> list[dict] | None:
+    path = _CACHE_DIR / f"{hashlib.sha1(page_url.encode()).hexdigest()}.parsed.json"
+    try:
+        data = json.loads(path.read_text())
+        if data["parser_version"] == PARSER_VERSION and data["html_sha1"] == html_digest:
+            return data["records"]
+    except Exception:
+        pass
+    return None
+
+
+def _parsed_cache_store(page_url: str, html_digest: str, records: list[dict]) -> None:
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _CACHE_DIR / f"{hashlib.sha1(page_url.encode()).hexdigest()}.parsed.json"
+        path.write_text(json.dumps(
+            {"parser_version": PARSER_VERSION, "html_sha1": html_digest, "records": records}
+        ))
+    except Exception:
+        pass
+
+
+def _cached(fetcher):
+    """Serve a fetcher's result from the on-disk cache when fresh enough."""
+    @functools.wraps(fetcher)
+    def wrapper(url: str, *args, force_refresh: bool = False, **kwargs):
+        if not force_refresh:
+            html = _cache_get(url)
+            if html is not None:
+                return html
+        html = fetcher(url, *args, **kwargs)
+        if html:
+            _cache_put(url, html)
+        return html
+    return wrapper
+
 # 99acres Bangalore project listing URLs by status
 SOURCE_URLS = {
     "new_launch": "https://www.99acres.com/new-launch-projects-in-bangalore-ffid",
@@ -52,7 +173,7 @@ NOBROKER_LISTING_URL = "https://www.nobroker.in/new-projects-in-bangalore"
 NOBROKER_PAGE_URL = "https://www.nobroker.in/new-projects-in-bangalore-page-{page}"
 
 # Names that are page titles / nav links, not actual project names (exclude from results)
-JUNK_PROJECT_NAMES = {
+JUNK_PROJECT_NAMES = frozenset({
     "new launch projects in bangalore",
     "under construction projects in bangalore",
     "ready to move projects in bangalore",
@@ -65,81 +186,235 @@ JUNK_PROJECT_NAMES = {
     "find other projects matching your search nearby",
     "quick links",
     "bangalore",
+})
+
+# Status prefixes of "... projects in bangalore" section titles; a single
+# startswith against a tuple replaces four chained checks per name.
+_JUNK_STATUS_PREFIXES = ("new ", "under ", "ready ", "upcoming ")
+
+# --- Precompiled regexes (hot parse paths; avoids re-cache lookups per call) ---
+# All price formats in one alternation so a card is scanned once; the groups are
+# dispatched in priority order in parse_price_range (ranges before single values).
+_RE_PRICE = re.compile(
+    r"(?P<cr_range>(?P<cr_lo>[\d.]+)\s*-\s*(?P<cr_hi>[\d.]+)\s*Cr)"
+    r"|(?P<l_range>(?P<lr_lo>[\d.]+)\s*(?:L|Lakh|Lac)\s*-\s*(?P<lr_hi>[\d.]+)\s*(?:L|Lakh|Lac))"
+    r"|(?P<l_cr>(?P<lc_lo>[\d.]+)\s*(?:L|Lakh|Lac)\s*-\s*(?P<lc_hi>[\d.]+)\s*Cr)"
+    r"|(?P<onwards>(?P<on_n>[\d.]+)\s*(?:lacs?|lakhs?|lac)\s+onwards?)"
+    r"|(?P<one_cr>(?:Starting\s+)?(?P<cr_n>[\d.]+)\s*Cr\s*(?:onwards)?)"
+    r"|(?P<one_l>(?P<l_n>[\d.]+)\s*(?:L|Lakh|Lac))",
+    re.I,
+)
+_PRICE_KINDS = ("cr_range", "l_range", "l_cr", "onwards", "one_cr", "one_l")
+_PRICE_CLEAN_TABLE = str.maketrans("", "", ",₹")
+_RE_POSSESSION_DATE = re.compile(r"(?:Possession:?\s*)?([A-Za-z]+\s+\d{4})", re.I)
+_RE_YEAR = re.compile(r"\d{4}")
+_RE_NPXID_STRIP = re.compile(r"-npxid.*", re.I)
+_ZONE_PATTERN = r"-bangalore-(?:north|south|east|west)$"
+# Known two-word localities (avoid splitting project name: "Prestige Raintree Park" not "Prestige Raintree" + "Park Whitefield")
+_TWO_WORD_LOCALITIES = (
+    "sarjapur-road", "hennur-road", "electronic-city", "kanakapura-road", "bannerghatta-road",
+    "begur-road", "hosur-road", "mysore-road", "devanahalli", "marathahalli", "whitefield",
+    "bagalur", "yelahanka", "varthur", "panathur", "nallurhalli", "kogilu", "nelamangala",
+    "kengeri", "uttarahalli", "rajarajeshwari-nagar", "hosa-road", "hebbal", "thanisandra",
+    "kr-puram", "malleshwaram", "horamavu", "gunjur", "budigere-cross", "doddaballapur",
+    "chandapura", "jigani", "anekal", "kasaba-hobli", "bidarahalli", "sarjapur", "hoskote",
+)
+# Both slug shapes in one pattern; the two-word alternative is tried first and
+# its names sorted longest-first so shared prefixes ("sarjapur-road" vs
+# "sarjapur") can't shadow the longer locality
+_RE_SLUG_LOCALITY = re.compile(
+    r"^(?P<two_name>.+)-(?P<two_loc>"
+    + "|".join(sorted(_TWO_WORD_LOCALITIES, key=len, reverse=True))
+    + r")" + _ZONE_PATTERN
+    + r"|^(?P<one_name>.+)-(?P<one_loc>[a-z0-9]+)" + _ZONE_PATTERN,
+    re.I,
+)
+# Project URLs: /path/slug-bangalore-zone-npxid-r123 or full url
+_RE_PROJECT_URL = re.compile(
+    r'(https?://(?:www\.)?99acres\.com/[^"\'<>\s]+?npxid[^"\'<>\s]*?r\d+)'
+    r'|(/(?:[a-z0-9-]+/)*[a-z0-9-]+-bangalore-(?:north|south|east|west)-npxid-r\d+[^"\'<>\s]*)',
+    re.I,
+)
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_WS = re.compile(r"\s+")
+_RE_BHK = re.compile(r"(\d[\d,\s]*)\s*BHK")
+# Deletes every non-[a-zA-Z0-9] byte in one C pass; ~10x faster than the
+# equivalent re.sub for the per-record id derivation from URLs.
+_ID_STRIP_TABLE = {
+    i: None for i in range(256)
+    if chr(i) not in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
 }
+_RE_PRICE_RANGE_COUNT = re.compile(r"[\d.]+[\s-]+[\d.]+\s*(?:L|Lakh|Lac|Cr)", re.I)
+_RE_LOCALITY_COMMA = re.compile(r"([A-Za-z\s]+),\s*Bangalore\s*(?:North|South|East|West)")
+
+
+# Worker processes for the CPU-bound listing parse (lxml + regex); created on
+# first use so single-page runs never pay the fork cost.
+_PARSE_POOL = None
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(
+            max_workers=min(PAGE_FETCH_CONCURRENCY, os.cpu_count() or 1)
+        )
+        atexit.register(_PARSE_POOL.shutdown)
+    return _PARSE_POOL
+
+
+# Playwright browser processes are reused across fetches: cold-starting Firefox/Chromium
+# costs ~1-2s per URL, while a fresh context per fetch is nearly free. The sync
+# Playwright API is bound to the thread that started it, so state is
+# thread-local: each worker thread gets (and must close) its own browser.
+_PW_STATE = threading.local()
+
+
+def _close_playwright() -> None:
+    """Close the current thread's browsers and Playwright driver."""
+    browsers = getattr(_PW_STATE, "browsers", None)
+    if browsers:
+        for browser in browsers.values():
+            try:
+                browser.close()
+            except Exception:
+                pass
+        browsers.clear()
+    pw = getattr(_PW_STATE, "pw", None)
+    if pw is not None:
+        try:
+            pw.stop()
+        except Exception:
+            pass
+        _PW_STATE.pw = None
+
+
+def _get_browser(engine: str):
+    """Start Playwright and launch the requested browser once per thread; reuse afterwards."""
+    from playwright.sync_api import sync_playwright
+    pw = getattr(_PW_STATE, "pw", None)
+    if pw is None:
+        pw = _PW_STATE.pw = sync_playwright().start()
+        _PW_STATE.browsers = {}
+        if threading.current_thread() is threading.main_thread():
+            # Worker threads clean up explicitly; atexit runs on the main thread
+            atexit.register(_close_playwright)
+    browser = _PW_STATE.browsers.get(engine)
+    if browser is not None and not browser.is_connected():
+        _PW_STATE.browsers.pop(engine, None)
+        browser = None
+    if browser is None:
+        if engine == "firefox":
+            browser = pw.firefox.launch(headless=True)
+        else:
+            browser = pw.chromium.launch(headless=True, args=["--disable-http2"])
+        _PW_STATE.browsers[engine] = browser
+    return browser
+
+
+# Resource types that never feed the scraped DOM; aborting them cuts most of
+# the bandwidth and speeds up page settle time.
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+def _block_heavy_resources(context) -> None:
+    context.route(
+        "**/*",
+        lambda route: route.abort()
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES
+        else route.continue_(),
+    )
 
 
 def _fetch_playwright(url: str) -> str | None:
-    """Fetch page HTML using Playwright. Tries Chromium (HTTP/2 disabled) then Firefox."""
+    """Fetch page HTML using Playwright. Tries Firefox then Chromium (HTTP/2 disabled)."""
     try:
-        from playwright.sync_api import sync_playwright
+        from playwright.sync_api import sync_playwright  # noqa: F401
     except ImportError:
         return None
     ua = REQUEST_HEADERS.get("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0")
 
-    def run_browser(browser, name: str) -> str | None:
+    def run_engine(engine: str) -> str | None:
+        context = None
         try:
-            page = browser.new_page(user_agent=ua)
+            browser = _get_browser(engine)
+            context = browser.new_context(user_agent=ua)
+            _block_heavy_resources(context)
+            page = context.new_page()
             page.goto(url, wait_until="domcontentloaded", timeout=30000)
             try:
                 page.wait_for_selector('a[href*="npxid"]', timeout=10000)
             except Exception:
                 pass
             time.sleep(2)
-            html = page.content()
-            browser.close()
-            return html
+            return page.content()
         except Exception as e:
-            print(f"  Playwright ({name}) failed: {e}")
-            try:
-                browser.close()
-            except Exception:
-                pass
+            print(f"  Playwright ({engine}) failed: {e}")
             return None
+        finally:
+            if context is not None:
+                try:
+                    context.close()
+                except Exception:
+                    pass
 
-    try:
-        with sync_playwright() as p:
-            # Use Firefox first (avoids ERR_HTTP2_PROTOCOL_ERROR that Chromium hits on 99acres)
-            browser = p.firefox.launch(headless=True)
-            html = run_browser(browser, "Firefox")
-            if html:
-                return html
-            print("  Trying Chromium...")
-            browser = p.chromium.launch(headless=True, args=["--disable-http2"])
-            return run_browser(browser, "Chromium")
-    except Exception as e:
-        print(f"  Playwright failed: {e}")
-        return None
+    # Use Firefox first (avoids ERR_HTTP2_PROTOCOL_ERROR that Chromium hits on 99acres)
+    html = run_engine("firefox")
+    if html:
+        return html
+    print("  Trying Chromium...")
+    return run_engine("chromium")
 
 
 def _fetch_playwright_generic(url: str, sleep_sec: int = 5) -> str | None:
     """Fetch URL with Playwright without 99acres-specific wait (for NoBroker etc)."""
     try:
-        from playwright.sync_api import sync_playwright
+        from playwright.sync_api import sync_playwright  # noqa: F401
     except ImportError:
         return None
     ua = REQUEST_HEADERS.get("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0")
+    context = None
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            try:
-                page = browser.new_page(user_agent=ua)
-                page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                time.sleep(sleep_sec)
-                html = page.content()
-                return html
-            finally:
-                try:
-                    browser.close()
-                except Exception:
-                    pass
+        # Same reused browser process as _fetch_playwright; contexts are cheap
+        browser = _get_browser("chromium")
+        context = browser.new_context(user_agent=ua)
+        _block_heavy_resources(context)
+        page = context.new_page()
+        page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        time.sleep(sleep_sec)
+        return page.content()
     except Exception as e:
         print(f"  Playwright (generic) failed: {e}")
         return None
+    finally:
+        if context is not None:
+            try:
+                context.close()
+            except Exception:
+                pass
+
+
+def _needs_js(html: str | None, marker: str | None = "npxid") -> bool:
+    """True when a plain-requests response looks like an unrendered JS shell."""
+    if not html or len(html) < 10000:
+        return True
+    return marker is not None and marker not in html
 
 
+@_cached
 def fetch(url: str, use_playwright: bool = True) -> str | None:
-    """Fetch URL: try Playwright first (gets JS-rendered content), then requests with retries."""
+    """Fetch URL: cheap requests probe first, Playwright only if the page needs JS."""
     if use_playwright:
+        # 99acres often serves the full listing to a plain UA; probing first
+        # saves the ~2s browser launch plus render waits on the happy path.
+        try:
+            r = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
+            r.raise_for_status()
+            html = r.content.decode(r.encoding or "utf-8", errors="replace")
+            if not _needs_js(html):
+                return html
+        except Exception:
+            pass
         html = _fetch_playwright(url)
         if html:
             return html
@@ -147,9 +422,11 @@ def fetch(url: str, use_playwright: bool = True) -> str | None:
     last_error = None
     for attempt in range(1, RETRY_ATTEMPTS + 1):
         try:
-            r = requests.get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
+            r = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
             r.raise_for_status()
-            return r.text
+            # Decode the bytes once ourselves: r.text runs a full charset-detection
+            # pass over the body when the header carries no charset.
+            return r.content.decode(r.encoding or "utf-8", errors="replace")
         except Exception as e:
             last_error = e
             print(f"  Attempt {attempt}/{RETRY_ATTEMPTS} failed: {e}")
@@ -166,15 +443,81 @@ def fetch(url: str, use_playwright: bool = True) -> str | None:
 DETAIL_PAGE_TIMEOUT = 10
 DETAIL_PAGE_TIMEOUT_TUPLE = (3, 6)  # 3s connect, 6s read; fail fast if NoBroker/99acres is slow
 
+async def _fetch_page_async(session, sem, url: str) -> str | None:
+    """Fetch one listing page inside the shared aiohttp session, with retries."""
+    async with sem:
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            try:
+                async with session.get(url) as resp:
+                    resp.raise_for_status()
+                    html = await resp.text()
+                # gzip+disk write runs in a worker thread so the loop keeps
+                # serving the other in-flight fetches meanwhile
+                await asyncio.to_thread(_cache_put, url, html)
+                return html
+            except Exception as e:
+                print(f"  Attempt {attempt}/{RETRY_ATTEMPTS} failed for {url}: {e}")
+                if attempt < RETRY_ATTEMPTS:
+                    await asyncio.sleep(RETRY_BACKOFF_SEC * (2 ** (attempt - 1)))
+        return None
+
+
+async def _fetch_pages_async(urls: list[str]) -> list[str | None]:
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    sem = asyncio.Semaphore(PAGE_FETCH_CONCURRENCY)
+    async with aiohttp.ClientSession(headers=REQUEST_HEADERS, timeout=timeout) as session:
+        return list(await asyncio.gather(*(_fetch_page_async(session, sem, u) for u in urls)))
+
+
+def fetch_all_sources() -> dict[str, str | None]:
+    """Fetch the first page of every 99acres status listing in parallel.
+
+    The three fetches are independent and I/O-bound (possibly each paying a
+    Playwright render), so wall time drops to roughly the slowest of the
+    three. Each worker closes its thread-local browser before retiring."""
+    def one(url: str) -> str | None:
+        try:
+            return fetch(url)
+        finally:
+            _close_playwright()
+
+    with ThreadPoolExecutor(max_workers=len(SOURCE_URLS)) as ex:
+        futures = {status: ex.submit(one, url) for status, url in SOURCE_URLS.items()}
+        return {status: f.result() for status, f in futures.items()}
+
+
+def fetch_pages(urls: list[str]) -> list[str | None]:
+    """Fetch several listing pages concurrently (aiohttp); sequential requests fallback."""
+    if not urls:
+        return []
+    if aiohttp is None:
+        return [fetch(u, use_playwright=False) for u in urls]
+    results = {u: _cache_get(u) for u in urls}
+    missing = [u for u, h in results.items() if h is None]
+    if missing:
+        # successful fetches are cached inside the coroutines
+        for u, h in zip(missing, asyncio.run(_fetch_pages_async(missing))):
+            results[u] = h
+    return [results[u] for u in urls]
+
+
+@_cached
 def fetch_nobroker(url: str) -> str | None:
-    """Fetch NoBroker listing page (JS-rendered); fallback to requests."""
+    """Fetch NoBroker listing page: requests probe first, Playwright when it needs JS."""
+    try:
+        r = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        r.raise_for_status()
+        if not _needs_js(r.text, marker=None):
+            return r.text
+    except Exception:
+        pass
     html = _fetch_playwright_generic(url, sleep_sec=5)
     if html and len(html) > 5000:
         return html
     print("  NoBroker Playwright failed or short response, trying requests...")
     for attempt in range(1, RETRY_ATTEMPTS + 1):
         try:
-            r = requests.get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
+            r = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
             r.raise_for_status()
             return r.text
         except Exception as e:
@@ -184,95 +527,163 @@ def fetch_nobroker(url: str) -> str | None:
     return None
 
 
+@_cached
 def fetch_nobroker_detail(url: str) -> str | None:
     """Fetch a single NoBroker detail page with requests only. Uses (connect, read) timeout to avoid hanging."""
     try:
-        r = requests.get(url, headers=REQUEST_HEADERS, timeout=DETAIL_PAGE_TIMEOUT_TUPLE)
+        r = _SESSION.get(url, timeout=DETAIL_PAGE_TIMEOUT_TUPLE)
         r.raise_for_status()
         return r.text
     except Exception:
         return None
 
 
+@_cached
 def fetch_99acres_detail(url: str) -> str | None:
     """Fetch a single 99acres project detail page (requests only, short timeout)."""
     if not url or "99acres.com" not in url or "npxid" not in url:
         return None
     try:
-        r = requests.get(url, headers=REQUEST_HEADERS, timeout=DETAIL_PAGE_TIMEOUT_TUPLE)
+        r = _SESSION.get(url, timeout=DETAIL_PAGE_TIMEOUT_TUPLE)
         r.raise_for_status()
         return r.text
     except Exception:
         return None
 
 
+# Detail pages are independent of each other, so up to this many fly at once
+DETAIL_FETCH_CONCURRENCY = 16
+
+
+async def _fetch_detail_async(session, sem, url: str) -> str | None:
+    """Fetch one detail page; failures return None like the serial fetchers."""
+    async with sem:
+        try:
+            async with session.get(url) as resp:
+                resp.raise_for_status()
+                html = await resp.text()
+            await asyncio.to_thread(_cache_put, url, html)
+            return html
+        except Exception:
+            return None
+
+
+async def _fetch_details_async(urls: list[str]) -> list[str | None]:
+    connect, read = DETAIL_PAGE_TIMEOUT_TUPLE
+    timeout = aiohttp.ClientTimeout(connect=connect, sock_read=read)
+    sem = asyncio.Semaphore(DETAIL_FETCH_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit_per_host=DETAIL_FETCH_CONCURRENCY)
+    async with aiohttp.ClientSession(
+        headers=REQUEST_HEADERS, timeout=timeout, connector=connector
+    ) as session:
+        return list(await asyncio.gather(*(_fetch_detail_async(session, sem, u) for u in urls)))
+
+
+def fetch_99acres_detail_many(urls: list[str]) -> list[str | None]:
+    """Fetch many 99acres detail pages concurrently; threaded fallback without aiohttp."""
+    if not urls:
+        return []
+    if aiohttp is None:
+        # requests releases the GIL while waiting, so threads still overlap
+        # the network round-trips; _SESSION's pool throttles per host.
+        with ThreadPoolExecutor(max_workers=DETAIL_FETCH_CONCURRENCY) as ex:
+            return list(ex.map(fetch_99acres_detail, urls))
+    valid = [u if (u and "99acres.com" in u and "npxid" in u) else None for u in urls]
+    results = {u: _cache_get(u) for u in valid if u}
+    missing = [u for u, h in results.items() if h is None]
+    if missing:
+        for u, h in zip(missing, asyncio.run(_fetch_details_async(missing))):
+            results[u] = h
+    return [results[u] if u else None for u in valid]
+
+
+def fetch_nobroker_detail_many(urls: list[str]) -> list[str | None]:
+    """Fetch many NoBroker detail pages concurrently; threaded fallback without aiohttp."""
+    if not urls:
+        return []
+    if aiohttp is None:
+        with ThreadPoolExecutor(max_workers=DETAIL_FETCH_CONCURRENCY) as ex:
+            return list(ex.map(fetch_nobroker_detail, urls))
+    results = {u: _cache_get(u) for u in urls}
+    missing = [u for u, h in results.items() if h is None]
+    if missing:
+        for u, h in zip(missing, asyncio.run(_fetch_details_async(missing))):
+            results[u] = h
+    return [results[u] for u in urls]
+
+
 def parse_price_range(text: str) -> tuple[float | None, float | None]:
     """Parse price into (min_lakhs, max_lakhs). Prefer one explicit range so we don't mix numbers from different listings."""
     if not text:
         return None, None
-    raw = text.replace(",", "").replace("₹", "").strip()
+    raw = text.translate(_PRICE_CLEAN_TABLE).strip()
+
+    # One scan collecting the first hit per price format, then dispatch by priority:
+    # explicit ranges > "onwards" minimums > single values.
+    first: dict[str, re.Match] = {}
+    for m in _RE_PRICE.finditer(raw):
+        for kind in _PRICE_KINDS:
+            if m.group(kind) is not None and kind not in first:
+                first[kind] = m
+                break
+        if len(first) == len(_PRICE_KINDS):
+            break
 
-    # 1) Prefer explicit "X - Y Cr" (both in Crore) -> convert to lakhs
-    m = re.search(r"([\d.]+)\s*-\s*([\d.]+)\s*Cr", raw, re.I)
+    # 1) "X - Y Cr" (both in Crore) -> convert to lakhs
+    m = first.get("cr_range")
     if m:
         try:
-            low, high = float(m.group(1)), float(m.group(2))
+            low, high = float(m.group("cr_lo")), float(m.group("cr_hi"))
             if low <= high and high < 1000:  # sane range in Cr
                 return low * 100, high * 100
         except ValueError:
             pass
-
     # 2) "X L - Y L" or "X Lakh - Y Lakh"
-    m = re.search(r"([\d.]+)\s*(?:L|Lakh|Lac)\s*-\s*([\d.]+)\s*(?:L|Lakh|Lac)", raw, re.I)
+    m = first.get("l_range")
     if m:
         try:
-            low, high = float(m.group(1)), float(m.group(2))
+            low, high = float(m.group("lr_lo")), float(m.group("lr_hi"))
             if low <= high and high < 10000:
                 return low, high
         except ValueError:
             pass
-
     # 3) "X L - Y Cr" (min in Lakh, max in Cr)
-    m = re.search(r"([\d.]+)\s*(?:L|Lakh|Lac)\s*-\s*([\d.]+)\s*Cr", raw, re.I)
+    m = first.get("l_cr")
     if m:
         try:
-            low, high = float(m.group(1)), float(m.group(2)) * 100
+            low, high = float(m.group("lc_lo")), float(m.group("lc_hi")) * 100
             if low <= high:
                 return low, high
         except ValueError:
             pass
-
     # 4) "X lacs onwards" / "X lac onwards" -> min only
-    m = re.search(r"([\d.]+)\s*(?:lacs?|lakhs?|lac)\s+onwards?", raw, re.I)
+    m = first.get("onwards")
     if m:
         try:
-            n = float(m.group(1))
+            n = float(m.group("on_n"))
             if n < 10000:
                 return n, None
         except ValueError:
             pass
-    # 5) "Starting ₹ X Cr" / "₹ X Cr onwards"
-    m = re.search(r"(?:Starting\s+)?(?:₹\s*)?([\d.]+)\s*Cr\s*(?:onwards)?", raw, re.I)
+    # 5) Single "Starting X Cr" / "X Cr onwards" -> min only if sane, else treat as point value
+    m = first.get("one_cr")
     if m:
         try:
-            n = float(m.group(1)) * 100
+            n = float(m.group("cr_n")) * 100
             if n < 10000:
                 return n, None
+            return n, n
         except ValueError:
             pass
-    # 6) Fallback: single "X Cr" or "X - Y Cr" already tried; try single "X L"
-    single_cr = re.search(r"([\d.]+)\s*Cr", raw, re.I)
-    single_l = re.search(r"([\d.]+)\s*(?:L|Lakh|Lac)", raw, re.I)
-    try:
-        if single_cr:
-            n = float(single_cr.group(1)) * 100
-            return n, n
-        if single_l:
-            n = float(single_l.group(1))
+    # 6) Fallback: single "X L"
+    m = first.get("one_l")
+    if m:
+        try:
+            n = float(m.group("l_n"))
             if n < 10000:
                 return n, n
-    except ValueError:
-        pass
+        except ValueError:
+            pass
     return None, None
 
 
@@ -283,12 +694,51 @@ def parse_possession(text: str) -> str | None:
     text = text.strip()
     if "ready to move" in text.lower() or "ready to move in" in text.lower():
         return "Ready to move"
-    m = re.search(r"(?:Possession:?\s*)?([A-Za-z]+\s+\d{4})", text, re.I)
+    m = _RE_POSSESSION_DATE.search(text)
     if m:
         return m.group(1).strip()
     return None
 
 
+# One left-to-right scan per card window collecting every field the card path
+# needs: ready-to-move mention, possession date, BHK list, and a cheap hint
+# that a price token exists at all. Alternatives mirror _RE_POSSESSION_DATE /
+# _RE_BHK (BHK stays case-sensitive via scoped flags) and the price hint is a
+# superset of what _RE_PRICE can match, so parse_price_range only runs when it
+# has something to find.
+_RE_CARD_SCAN = re.compile(
+    r"(?i:(?P<ready>ready\s+to\s+move))"
+    r"|(?i:(?:Possession:?\s*)?(?P<poss_date>[A-Za-z]+\s+\d{4}))"
+    r"|(?P<bhk_n>\d[\d,\s]*)\s*BHK"
+    r"|(?i:(?P<price_hint>[\d₹][\d.,]*\s*(?:-\s*[\d.,]+\s*)?(?:Cr|Lakhs?|Lacs?|L\b)))"
+)
+
+
+def _scan_card_fields(text: str) -> tuple[float | None, float | None, str | None, str]:
+    """Extract (price_min, price_max, possession, bhk) from card text in one scan."""
+    ready = False
+    poss_date = None
+    bhk = ""
+    has_price = False
+    for m in _RE_CARD_SCAN.finditer(text):
+        if m.group("ready"):
+            ready = True
+        elif m.group("poss_date"):
+            if poss_date is None:
+                poss_date = m.group("poss_date").strip()
+        elif m.group("bhk_n"):
+            if not bhk:
+                bhk = m.group("bhk_n").strip()
+        else:
+            has_price = True
+        # "Ready to move" wins over any date, so only then is the rest settled
+        if ready and bhk and has_price:
+            break
+    price_min, price_max = parse_price_range(text) if has_price else (None, None)
+    possession = "Ready to move" if ready else poss_date
+    return price_min, price_max, possession, bhk
+
+
 def _is_junk_project_name(name: str) -> bool:
     """Return True if name is a page title/nav text, not a real project name."""
     if not name or len(name) < 4:
@@ -296,8 +746,8 @@ def _is_junk_project_name(name: str) -> bool:
     key = name.strip().lower()[:120]
     if key in JUNK_PROJECT_NAMES:
         return True
-    if "projects in bangalore" in key or ("projects in " in key and "bangalore" in key):
-        if key.startswith("new ") or key.startswith("under ") or key.startswith("ready ") or key.startswith("upcoming "):
+    if "projects in " in key and "bangalore" in key:
+        if key.startswith(_JUNK_STATUS_PREFIXES):
             return True
     # Section titles like "New Projects by Reputed Bangalore Builders in bangalore"
     if "by reputed" in key and "builders" in key and "bangalore" in key:
@@ -308,19 +758,17 @@ def _is_junk_project_name(name: str) -> bool:
 def _format_price_display(min_p: float | None, max_p: float | None) -> str:
     if min_p is None and max_p is None:
         return ""
-    if min_p is None:
-        min_p = max_p
-    if max_p is None:
-        max_p = min_p
-    if max_p >= 100:
-        return f"₹ {min_p/100:.2f} - {max_p/100:.2f} Cr"
-    return f"₹ {min_p:.2f} - {max_p:.2f} L"
+    a = min_p if min_p is not None else max_p
+    b = max_p if max_p is not None else min_p
+    if b >= 100:
+        return f"₹ {a*0.01:.2f} - {b*0.01:.2f} Cr"
+    return f"₹ {a:.2f} - {b:.2f} L"
 
 
 def _year_from_possession(possession: str | None) -> int | None:
     if not possession or "ready" in possession.lower():
         return None
-    m = re.search(r"\d{4}", possession)
+    m = _RE_YEAR.search(possession)
     return int(m.group(0)) if m else None
 
 
@@ -329,6 +777,12 @@ PROPERTY_JUNK_SUBSTRINGS = (
     "filter your search", "sort by", "reset", "list", "map", "quick links",
     "find other projects", "next >>", "<< prev", "bangalore, india", "property list",
 )
+# All junk phrases as one alternation (longest first so "property list" wins
+# over "list"); a single sub replaces the per-phrase loop in _normalize_str.
+_RE_JUNK_ALT = re.compile(
+    "|".join(re.escape(j) for j in sorted(PROPERTY_JUNK_SUBSTRINGS, key=len, reverse=True)),
+    re.I,
+)
 
 # Sane bounds for price (lakhs) and handover year
 PRICE_MAX_LAKHS = 50000
@@ -341,13 +795,14 @@ def _normalize_str(s: str | None, max_len: int = 200) -> str:
     """Trim, collapse spaces, and cap length. Empty or only junk -> ''."""
     if not s or not isinstance(s, str):
         return ""
-    t = re.sub(r"\s+", " ", s.strip())
+    t = _RE_WS.sub(" ", s.strip())
     if not t:
         return ""
-    for junk in PROPERTY_JUNK_SUBSTRINGS:
-        if junk in t.lower():
-            t = re.sub(re.escape(junk), " ", t, flags=re.I)
-            t = re.sub(r"\s+", " ", t).strip()
+    # Most field values carry no junk at all; a cheap substring check on the
+    # lowercased string skips the alternation sub for the common case.
+    tl = t.lower()
+    if any(j in tl for j in PROPERTY_JUNK_SUBSTRINGS):
+        t = _RE_WS.sub(" ", _RE_JUNK_ALT.sub(" ", t)).strip()
     return t[:max_len] if t else ""
 
 
@@ -361,6 +816,10 @@ def verify_and_clean_property(record: dict) -> dict | None:
     """
     if not record or not isinstance(record, dict):
         return None
+    # Records that already came out of this function pass through untouched;
+    # re-cleaning them would just repeat every normalization regex.
+    if record.get("_verified"):
+        return record
     url = (record.get("url") or "").strip()
     if not url or "http" not in url:
         return None
@@ -407,7 +866,7 @@ def verify_and_clean_property(record: dict) -> dict | None:
     if status not in ("new_launch", "under_construction", "ready_to_move"):
         status = "new_launch"
     source = (record.get("source") or "").strip() or "99acres"
-    pid = (record.get("id") or "").strip() or re.sub(r"[^a-zA-Z0-9]", "", url)[-14:]
+    pid = (record.get("id") or "").strip() or url.translate(_ID_STRIP_TABLE)[-14:]
 
     return {
         "id": pid,
@@ -423,6 +882,7 @@ def verify_and_clean_property(record: dict) -> dict | None:
         "handover_year": hy,
         "bhk": bhk,
         "url": url,
+        "_verified": True,
     }
 
 
@@ -434,63 +894,114 @@ def extract_builder_from_title(title: str) -> str:
     return words[0] if words else ""
 
 
+# Single-pass C transforms for URL slugs; _URL_TRIM documents the charset
+# stripped from trailing punctuation when URLs are pulled out of raw text.
+_DASH_TO_SPACE = str.maketrans({"-": " "})
+_URL_TRIM = ".,;:)"
+
+
+def _slug_to_title(slug: str) -> str:
+    """'sarjapur-road' -> 'Sarjapur Road'."""
+    return slug.translate(_DASH_TO_SPACE).strip().title()
+
+
+def _absolutize(href: str, origin: str, base_url: str) -> str:
+    """Resolve href against a precomputed scheme://netloc origin.
+
+    urljoin parses both URLs on every call (~10us); nearly all listing
+    hrefs are absolute or root-relative, so it only runs for the rare
+    relative-path case."""
+    if href.startswith("http"):
+        return href
+    if href.startswith("/"):
+        return origin + href
+    return urljoin(base_url, href)
+
+
 def _name_and_locality_from_href(href: str) -> tuple[str, str]:
     """Derive project name and locality from URL slug. Locality = 1 or 2 segments (Whitefield | Sarjapur Road)."""
     path = href.split("?")[0]
     slug = path.rstrip("/").split("/")[-1] or ""
     if "-npxid" not in slug or "bangalore" not in slug.lower():
         return "", ""
-    before_npxid = re.sub(r"-npxid.*", "", slug, flags=re.I).strip()
-    zone = r"-bangalore-(north|south|east|west)$"
-    # Known two-word localities (avoid splitting project name: "Prestige Raintree Park" not "Prestige Raintree" + "Park Whitefield")
-    two_word_locality = re.search(r"^(.+)-(sarjapur-road|hennur-road|electronic-city|kanakapura-road|bannerghatta-road|begur-road|hosur-road|mysore-road|devanahalli|marathahalli|whitefield|bagalur|yelahanka|varthur|panathur|nallurhalli|kogilu|nelamangala|kengeri|uttarahalli|rajarajeshwari-nagar|hosa-road|hebbal|thanisandra|kr-puram|malleshwaram|horamavu|gunjur|budigere-cross|doddaballapur|chandapura|jigani|anekal|kasaba-hobli|bidarahalli|sarjapur|hoskote)" + zone, before_npxid, re.I)
-    if two_word_locality:
-        name_slug, locality_slug = two_word_locality.group(1), two_word_locality.group(2)
-        return name_slug.replace("-", " ").strip().title()[:200], locality_slug.replace("-", " ").strip().title()[:100]
-    one_seg = re.search(r"^(.+)-([a-z0-9]+)" + zone, before_npxid, re.I)
-    if one_seg:
-        name_slug, locality_slug = one_seg.group(1), one_seg.group(2)
-        return name_slug.replace("-", " ").strip().title()[:200], locality_slug.replace("-", " ").strip().title()[:100]
-    name = before_npxid.replace("-", " ").strip().title()
-    return name[:200], ""
+    before_npxid = _RE_NPXID_STRIP.sub("", slug).strip()
+    m = _RE_SLUG_LOCALITY.match(before_npxid)
+    if m:
+        if m.group("two_loc") is not None:
+            name_slug, locality_slug = m.group("two_name"), m.group("two_loc")
+        else:
+            name_slug, locality_slug = m.group("one_name"), m.group("one_loc")
+        return _slug_to_title(name_slug)[:200], _slug_to_title(locality_slug)[:100]
+    return _slug_to_title(before_npxid)[:200], ""
+
+
+def _strip_tags_with_map(html: str) -> tuple[str, list[int], list[int]]:
+    """Replace every tag with one space in a single pass, returning the
+    stripped text plus parallel (raw_starts, stripped_starts) segment offsets
+    so raw positions can be mapped into the stripped text with bisect."""
+    parts: list[str] = []
+    raw_starts: list[int] = []
+    stripped_starts: list[int] = []
+    pos = 0
+    out_len = 0
+    for m in _RE_TAG.finditer(html):
+        if m.start() > pos:
+            raw_starts.append(pos)
+            stripped_starts.append(out_len)
+            seg = html[pos:m.start()]
+            parts.append(seg)
+            out_len += len(seg)
+        parts.append(" ")
+        out_len += 1
+        pos = m.end()
+    if pos < len(html):
+        raw_starts.append(pos)
+        stripped_starts.append(out_len)
+        parts.append(html[pos:])
+    return "".join(parts), raw_starts, stripped_starts
 
 
 def _extract_from_raw_html(html: str, base_url: str, status: str) -> list[dict]:
     """Fallback: find project URLs and price/possession in raw HTML (e.g. when DOM has no cards)."""
-    # Find all project URLs: /path/slug-bangalore-zone-npxid-r123 or full url
-    url_pattern = re.compile(
-        r'(https?://(?:www\.)?99acres\.com/[^"\'<>\s]+?npxid[^"\'<>\s]*?r\d+)'
-        r'|(/(?:[a-z0-9-]+/)*[a-z0-9-]+-bangalore-(?:north|south|east|west)-npxid-r\d+[^"\'<>\s]*)',
-        re.I
-    )
     seen_urls = set()
     results = []
-    for m in url_pattern.finditer(html):
-        full_url = m.group(1) or urljoin(base_url, m.group(2))
+    sp = urlsplit(base_url)
+    origin = f"{sp.scheme}://{sp.netloc}"
+    # Strip tags once for the whole page instead of once per URL window
+    stripped, raw_starts, stripped_starts = _strip_tags_with_map(html)
+
+    def stripped_pos(p: int) -> int:
+        # Approximate: positions inside a tag land just past their segment
+        i = bisect_right(raw_starts, p) - 1
+        if i < 0:
+            return 0
+        return stripped_starts[i] + (p - raw_starts[i])
+
+    for m in _RE_PROJECT_URL.finditer(html):
+        full_url = m.group(1) or _absolutize(m.group(2), origin, base_url)
         if not full_url or "bangalore" not in full_url.lower() or "npxid" not in full_url:
             continue
-        full_url = full_url.split("?")[0].rstrip(".,;:)")
+        full_url = full_url.split("?")[0].rstrip(_URL_TRIM)
         if full_url in seen_urls:
             continue
         seen_urls.add(full_url)
-        # Get a window of text around this URL (500 chars before, 800 after) to find price/possession
-        start = max(0, m.start() - 500)
-        end = min(len(html), m.end() + 800)
-        window = html[start:end]
-        # Strip tags for regex
-        window_text = re.sub(r"<[^>]+>", " ", window)
-        window_text = re.sub(r"\s+", " ", window_text)
+        cached = _PARSED_CACHE.get(full_url)
+        if cached is not None:
+            results.append({**cached, "status": status})
+            continue
+        # Window of pre-stripped text around this URL (500 chars before, 800
+        # after); only whitespace collapse is paid per URL
+        start = max(0, stripped_pos(m.start()) - 500)
+        end = stripped_pos(m.end()) + 800
+        window_text = " ".join(stripped[start:end].split())
         slug = full_url.split("/")[-1] or full_url
         name, locality = _name_and_locality_from_href("/" + slug)
         if not name:
             slug = full_url.split("/")[-1] or full_url
-            name = re.sub(r"-npxid.*", "", slug.replace("-", " ")).title() or "Project"
-        price_min, price_max = parse_price_range(window_text)
-        possession = parse_possession(window_text)
-        bhk_match = re.search(r"(\d[\d,\s]*)\s*BHK", window_text)
-        bhk = bhk_match.group(1).strip() if bhk_match else ""
-        results.append({
-            "id": re.sub(r"[^a-zA-Z0-9]", "", full_url)[-12:] or str(len(results)),
+            name = _RE_NPXID_STRIP.sub("", slug.translate(_DASH_TO_SPACE)).title() or "Project"
+        price_min, price_max, possession, bhk = _scan_card_fields(window_text)
+        record = {
+            "id": full_url.translate(_ID_STRIP_TABLE)[-12:] or str(len(results)),
             "source": "99acres",
             "status": status,
             "name": name[:200],
@@ -498,45 +1009,119 @@ def _extract_from_raw_html(html: str, base_url: str, status: str) -> list[dict]:
             "locality": locality,
             "price_min_lakhs": price_min,
             "price_max_lakhs": price_max,
-            "price_display": _format_price_display(price_min, price_max),
+            "price_display": "" if price_min is None and price_max is None
+            else _format_price_display(price_min, price_max),
             "handover": possession,
             "handover_year": _year_from_possession(possession),
             "bhk": bhk,
             "url": full_url,
-        })
+        }
+        _cache_parsed(full_url, record)
+        results.append(record)
     return results
 
 
-def _card_text_for_link(a, soup) -> str:
-    """Get text from the smallest parent that has at most one price range; else use first parent with a price."""
-    parent = a.find_parent(["div", "article", "section", "li"])
+# Cross-listing cache: the same project shows up in several status listings and on
+# adjacent pages; skip the regex-heavy field extraction when a URL repeats.
+_PARSED_CACHE: dict[str, dict] = {}
+_PARSED_CACHE_MAX = 10_000
+
+
+def _cache_parsed(url: str, record: dict) -> None:
+    if len(_PARSED_CACHE) >= _PARSED_CACHE_MAX:
+        _PARSED_CACHE.pop(next(iter(_PARSED_CACHE)))  # drop oldest (FIFO)
+    _PARSED_CACHE[url] = record
+
+
+# Tags that usually delimit one listing card in the DOM
+_CARD_ANCESTOR_TAGS = {"div", "article", "section", "li"}
+
+
+def _iter_card_ancestors(a):
+    """Yield ancestors of an lxml anchor that look like card containers, nearest first."""
+    parent = a.getparent()
+    while parent is not None:
+        if parent.tag in _CARD_ANCESTOR_TAGS:
+            yield parent
+        parent = parent.getparent()
+
+
+def _elem_text(elem) -> str:
+    """Whitespace-collapsed text of an lxml element, one space between text nodes."""
+    return " ".join(" ".join(elem.itertext()).split())
+
+
+def _elem_text_capped(elem, cap: int) -> str | None:
+    """_elem_text that stops accumulating once raw text exceeds cap (-> None).
+    Keeps page-level ancestors (body/html) from materialising their whole
+    subtree text just to be discarded as too large."""
+    parts = []
+    total = 0
+    for t in elem.itertext():
+        parts.append(t)
+        total += len(t)
+        if total > cap:
+            return None
+    return " ".join(" ".join(parts).split())
+
+
+def _card_text_for_link(a, text_cache: dict | None = None) -> str:
+    """Get text from the smallest ancestor that has at most one price range; else use first ancestor with a price.
+
+    text_cache maps ancestor elements to their collapsed text; anchors on the
+    same listing page share most ancestors, so one dict per parse avoids
+    re-walking the same subtrees for every card."""
     candidate_with_price = ""
-    while parent and parent != soup:
-        block = (parent.get_text(separator=" ", strip=True) or "").strip()
-        if len(block) > 5000:
-            parent = parent.find_parent(["div", "article", "section", "li"])
+    for parent in _iter_card_ancestors(a):
+        if text_cache is not None and parent in text_cache:
+            block = text_cache[parent]
+        else:
+            # Raw cap is 4x the collapsed limit: whitespace runs shrink on collapse
+            block = _elem_text_capped(parent, 20000)
+            if text_cache is not None:
+                text_cache[parent] = block
+        if block is None or len(block) > 5000:
             continue
-        price_ranges = re.findall(r"[\d.]+[\s-]+[\d.]+\s*(?:L|Lakh|Lac|Cr)", block, re.I)
+        price_ranges = _RE_PRICE_RANGE_COUNT.findall(block)
         if not candidate_with_price and price_ranges:
             candidate_with_price = block
         if len(price_ranges) <= 1 and len(block) >= 80:
             return block
-        parent = parent.find_parent(["div", "article", "section", "li"])
-    return candidate_with_price or (a.get_text(separator=" ", strip=True) or "").strip()
+    return candidate_with_price or _elem_text(a)
 
 
-def scrape_99acres_list(html: str, base_url: str, status: str) -> list[dict]:
-    """Parse 99acres listing HTML and return list of property dicts with clear per-card details."""
-    soup = BeautifulSoup(html, "html.parser")
+def scrape_99acres_list(html: str | bytes, base_url: str, status: str) -> list[dict]:
+    """Parse 99acres listing HTML (str or raw bytes) and return list of property dicts with clear per-card details."""
+    # Both the DOM path and the regex fallback key off npxid project URLs;
+    # without any, skip building the tree at all (e.g. error/captcha pages)
+    if not html or (b"npxid" if isinstance(html, bytes) else "npxid") not in html:
+        return []
+    try:
+        # lxml takes bytes directly and decodes in C; no need for a str upfront
+        tree = lxml_html.fromstring(html)
+        anchors = tree.xpath('//a[contains(@href, "npxid")]')
+    except Exception:
+        anchors = []
+    if isinstance(html, bytes):
+        # The regex fallback below works on text; decode once here
+        html = html.decode("utf-8", errors="replace")
     results = []
-
-    for a in soup.find_all("a", href=True):
-        href = a.get("href", "")
-        if "npxid" not in href or "bangalore" not in href.lower():
+    text_cache: dict = {}  # ancestor element -> collapsed text, shared across cards
+    sp = urlsplit(base_url)
+    origin = f"{sp.scheme}://{sp.netloc}"
+
+    for a in anchors:
+        # The XPath above already guarantees "npxid" is present
+        href = a.get("href") or ""
+        if "bangalore" not in href.lower():
             continue
-        full_url = urljoin(base_url, href).split("?")[0]
+        full_url = _absolutize(href, origin, base_url).split("?")[0]
         if not full_url.startswith("http"):
             continue
+        cached = _PARSED_CACHE.get(full_url)
+        if cached is not None:
+            results.append({**cached, "status": status})
+            continue
 
         # Prefer name & locality from URL (source of truth for which project this link points to).
         # DOM text often comes from a different card on the listing page and causes wrong names.
@@ -545,46 +1130,44 @@ def scrape_99acres_list(html: str, base_url: str, status: str) -> list[dict]:
             name = url_name
             locality = url_locality or ""
         else:
-            name = (a.get_text(strip=True) or "").strip()
+            name = _elem_text(a)
             if len(name) < 5 or len(name) > 200:
                 name = ""
-            parent = a.find_parent(["div", "article", "section", "li"])
-            if parent:
-                for tag in ["h2", "h3", "h4", "strong"]:
-                    for h in parent.find_all(tag):
-                        t = (h.get_text(strip=True) or "").strip()
+            parent = next(_iter_card_ancestors(a), None)
+            if parent is not None:
+                for tag in ("h2", "h3", "h4", "strong"):
+                    for h in parent.iter(tag):
+                        t = _elem_text(h)
                         if 5 <= len(t) <= 200 and "Bangalore" not in t:
                             name = name or t
                             break
                     if name:
                         break
             if not name or len(name) < 5:
-                name = re.sub(r"-npxid.*", "", href.split("/")[-1].replace("-", " ")).title()
+                name = _RE_NPXID_STRIP.sub("", href.split("/")[-1].translate(_DASH_TO_SPACE)).title()
             name = (name or "Project").strip()[:200]
             locality = ""
-            block_text = _card_text_for_link(a, soup)
-            loc_m = re.search(r"([A-Za-z\s]+),\s*Bangalore\s*(?:North|South|East|West)", block_text)
+            block_text = _card_text_for_link(a, text_cache)
+            loc_m = _RE_LOCALITY_COMMA.search(block_text)
             if loc_m:
                 locality = loc_m.group(1).strip()[:100]
             if not locality:
                 locality = url_locality
 
         # Use card-scoped text for price/possession/BHK only (not name/locality when URL had them)
-        block_text = _card_text_for_link(a, soup)
+        block_text = _card_text_for_link(a, text_cache)
 
-        price_min, price_max = parse_price_range(block_text)
-        possession = parse_possession(block_text)
+        # One combined scan instead of separate price/possession/BHK passes
+        price_min, price_max, possession, bhk = _scan_card_fields(block_text)
         if not locality:
-            loc_m = re.search(r"([A-Za-z\s]+),\s*Bangalore\s*(?:North|South|East|West)", block_text)
+            loc_m = _RE_LOCALITY_COMMA.search(block_text)
             if loc_m:
                 locality = loc_m.group(1).strip()[:100]
             if not locality:
                 locality = url_locality
-        bhk_match = re.search(r"(\d[\d,\s]*)\s*BHK", block_text)
-        bhk = (bhk_match.group(1).strip() if bhk_match else "").strip()
 
         # Build clean record
-        prop_id = re.sub(r"[^a-zA-Z0-9]", "", href)[-12:] or str(len(results))
+        prop_id = href.translate(_ID_STRIP_TABLE)[-12:] or str(len(results))
         record = {
             "id": prop_id,
             "source": "99acres",
@@ -594,7 +1177,8 @@ def scrape_99acres_list(html: str, base_url: str, status: str) -> list[dict]:
             "locality": locality[:100] if locality else "",
             "price_min_lakhs": price_min,
             "price_max_lakhs": price_max,
-            "price_display": _format_price_display(price_min, price_max),
+            "price_display": "" if price_min is None and price_max is None
+            else _format_price_display(price_min, price_max),
             "handover": (possession.strip() if possession else "") or "",
             "handover_year": _year_from_possession(possession),
             "bhk": bhk,
@@ -602,40 +1186,133 @@ def scrape_99acres_list(html: str, base_url: str, status: str) -> list[dict]:
         }
         if _is_junk_project_name(record["name"]):
             continue
+        _cache_parsed(full_url, record)
         results.append(record)
 
-    # Dedupe by url
-    seen = set()
-    unique = []
-    for r in results:
-        if r["url"] not in seen:
-            seen.add(r["url"])
-            unique.append(r)
+    # Dedupe by url (dict comprehension runs in C; insertion order is kept)
+    by_url = {r["url"]: r for r in results}
+
+    # If lxml found no/very few cards, try regex on raw HTML (works when content is in script or odd structure)
+    if len(by_url) < 3 and len(html) > 5000:
+        for r in _extract_from_raw_html(html, base_url, status):
+            by_url.setdefault(r["url"], r)
+    return list(by_url.values())
+
+
+def _scrape_99acres_cached(html: str | bytes, page_url: str, status: str) -> list[dict]:
+    """scrape_99acres_list, but served from the parsed-record cache when the
+    page's HTML and the parser version both match the stored entry."""
+    if not html:
+        return []
+    raw = html if isinstance(html, bytes) else html.encode("utf-8", "replace")
+    digest = hashlib.sha1(raw).hexdigest()
+    records = _parsed_cache_load(page_url, digest)
+    if records is None:
+        records = scrape_99acres_list(html, page_url, status)
+        _parsed_cache_store(page_url, digest, records)
+    return records
+
+
+def _scrape_nobroker_cached(html: str, base_url: str, page_url: str) -> list[dict]:
+    """scrape_nobroker_list behind the same parsed-record cache, keyed by page URL."""
+    if not html:
+        return []
+    digest = hashlib.sha1(html.encode("utf-8", "replace")).hexdigest()
+    records = _parsed_cache_load(page_url, digest)
+    if records is None:
+        records = scrape_nobroker_list(html, base_url)
+        _parsed_cache_store(page_url, digest, records)
+    return records
 
-    # If BeautifulSoup found no/very few cards, try regex on raw HTML (works when content is in script or odd structure)
-    if len(unique) < 3 and len(html) > 5000:
-        raw_list = _extract_from_raw_html(html, base_url, status)
-        for r in raw_list:
-            if r["url"] not in seen:
-                seen.add(r["url"])
-                unique.append(r)
-    return unique
+
+_RE_NON_SLUG = re.compile(r"[^a-z0-9]+")
+_RE_BANGALORE_TAIL = re.compile(r",\s*Bangalore.*", re.I)
 
 
 def _nobroker_slug(name: str, locality: str) -> str:
     """Build a URL slug from project name and locality for NoBroker-style URLs."""
     parts = []
     if name:
-        parts.append(re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:80])
+        parts.append(_RE_NON_SLUG.sub("-", name.lower()).strip("-")[:80])
     if locality:
-        loc_clean = re.sub(r",\s*Bangalore.*", "", locality, flags=re.I).strip()
+        loc_clean = _RE_BANGALORE_TAIL.sub("", locality).strip()
         if loc_clean:
-            parts.append(re.sub(r"[^a-z0-9]+", "-", loc_clean.lower()).strip("-")[:50])
+            parts.append(_RE_NON_SLUG.sub("-", loc_clean.lower()).strip("-")[:50])
     if not parts:
         return "project-bangalore"
     return "-".join(parts) + "-bangalore"
 
 
+# Detail-page and card patterns, compiled once at import instead of per call
+# (the parsers below run for every one of 200+ detail pages per enrich run).
+_RE_NB_BUILDER_LINE = re.compile(r"(Group|Developers?|Limited|Pvt|Builders?|Realty|Ventures?|Constructions?)$", re.I)
+_RE_NB_BHK_LINE = re.compile(r"BHK[-\s]*([\d.,\s]+)", re.I)
+# Matched against the already-lowercased page text, so no re.I: case-folding
+# every candidate character disables several matcher fast paths.
+_NB_PRICE_PATTERNS = [re.compile(p) for p in (
+    r"₹\s*([\d.]+)\s*cr\s*-\s*₹?\s*([\d.]+)\s*cr",
+    r"rs\.\s*([\d.]+)\s*crores?\s+to\s+rs\.\s*([\d.]+)\s*crores?",
+    r"([\d.]+)\s*crores?\s*-\s*([\d.]+)\s*crores?",
+)]
+_RE_NB_BY = re.compile(r"By\s+([A-Za-z][A-Za-z0-9\s&.,'-]{2,80}?)(?:\s+Est\.|\s*$|\.)")
+# Bounded segment counts/lengths: the unbounded (?:[^,]+,)* form could
+# backtrack quadratically on junk pages that mention "Near" without a
+# matching address tail. Real addresses fit comfortably in 7 segments
+# of 80 chars.
+_RE_NB_ADDRESS = re.compile(r"(Near\s+[^,]{1,80},(?:\s*[^,]{1,80},){0,6}\s*[^,]{1,80},\s*Bangalore\.?)")
+_RE_NB_LOCALITY = re.compile(r"([A-Za-z][^.]{15,120}?,?\s*(?:Gunjur|Varthur|Whitefield|Sarjapur|Bellandur|Marathahalli)[^.]{0,120}?Bangalore\.?)")
+_RE_NB_BHK = re.compile(r"(\d[\d.,\s]*(?:\d+\.?\d*)?)\s*BHK")
+# "ready" counts as ready-to-move only when no possession date trails it
+# (e.g. "ready by Possession in Dec 2028" is under construction). Matched
+# against the lowercased text, so no re.I.
+_RE_READY_CONTEXT = re.compile(r"ready(?![\s\S]{0,50}possession)")
+_RE_NB_NAME_LOC = re.compile(r"([A-Za-z0-9][A-Za-z0-9\s&\.\'-]{4,120}),\s*([^,<]+),\s*Bangalore\s*,?\s*India")
+# Heading form ("# Name Locality, Bangalore") and title form ("Name,
+# Locality, Bangalore - Price") fused into one scan; the heading form keeps
+# priority at the call site.
+_RE_99_NAME_LOC = re.compile(
+    r"#\s*(?P<n1>[A-Za-z0-9][A-Za-z0-9\s&.\'-]{3,100}?)\s+(?P<l1>[A-Za-z][A-Za-z\s]+),\s*Bangalore"
+    r"|(?P<n2>[A-Za-z0-9][A-Za-z0-9\s&.\'-]{3,80}),\s*(?P<l2>[A-Za-z][A-Za-z\s]+),\s*Bangalore\s*-\s*Price"
+)
+_RE_99_BROUGHT_BY = re.compile(r"Brought\s+to\s+you\s+by\s+([A-Za-z][A-Za-z0-9\s&.,\'-]+?)\s*[,.]", re.I)
+_RE_99_ABOUT = re.compile(r"About\s+([A-Za-z][A-Za-z0-9\s&.,\'-]{2,60}?)\s+The\s+[A-Za-z]", re.I)
+_RE_99_BHK_APT = re.compile(r"(?:PRICE\s*RANGE\s*)?(\d[\d.,\s]*)\s*BHK\s+Apartment", re.I)
+_RE_99_BHK = re.compile(r"(\d[\d.,\s]+)\s*BHK")
+# Status keywords + both possession forms fused into one scan over the page
+# text; the old if/elif priority (under construction > ready > new launch,
+# completion > possession) is applied after the loop. Text is already
+# whitespace-collapsed, so literal single spaces suffice.
+_RE_STATUS_POSS = re.compile(
+    r"(?i:(?P<uc>under construction))"
+    r"|(?i:(?P<rtm>ready to move))"
+    r"|(?i:(?P<nl>new launch))"
+    r"|(?i:completion from (?P<cmonth>[A-Za-z]+),\s*(?P<cyear>\d{4}) onwards)"
+    r"|(?i:possession (?:in )?(?P<poss>[A-Za-z]+ \d{4}))"
+)
+
+
+def _scan_status_possession(text: str) -> tuple[bool, bool, bool, tuple[str, str] | None, str | None]:
+    """One pass collecting (under_construction, ready, new_launch,
+    (completion_month, year) | None, possession | None)."""
+    saw_uc = saw_rtm = saw_nl = False
+    completion = possession = None
+    for m in _RE_STATUS_POSS.finditer(text):
+        if m.group("uc"):
+            saw_uc = True
+        elif m.group("rtm"):
+            saw_rtm = True
+        elif m.group("nl"):
+            saw_nl = True
+        elif m.group("cmonth"):
+            if completion is None:
+                completion = (m.group("cmonth"), m.group("cyear"))
+        elif possession is None:
+            possession = m.group("poss")
+        if saw_uc and completion is not None:
+            break  # both top-priority outcomes settled
+    return saw_uc, saw_rtm, saw_nl, completion, possession
+
+
 def _parse_nobroker_card_text(block: str, project_url: str) -> dict | None:
     """Parse one NoBroker card text block into a property dict. Returns None if too little info."""
     block = (block or "").strip()
@@ -675,7 +1352,7 @@ def _parse_nobroker_card_text(block: str, project_url: str) -> dict | None:
     # Builder: line after price or "X Group" / "X Developers"
     builder = ""
     for ln in lines:
-        if re.search(r"(Group|Developers?|Limited|Pvt|Builders?|Realty|Ventures?|Constructions?)$", ln, re.I) and len(ln) < 80:
+        if _RE_NB_BUILDER_LINE.search(ln) and len(ln) < 80:
             builder = ln.strip()[:100]
             break
     if not builder and name:
@@ -683,7 +1360,7 @@ def _parse_nobroker_card_text(block: str, project_url: str) -> dict | None:
     # BHK from "BHK-2,3,4" or "Configurations" "BHK-x"
     bhk = ""
     for ln in lines:
-        bhk_m = re.search(r"BHK[-\s]*([\d.,\s]+)", ln, re.I)
+        bhk_m = _RE_NB_BHK_LINE.search(ln)
         if bhk_m:
             bhk = bhk_m.group(1).strip().replace(" ", "")[:30]
             break
@@ -698,7 +1375,7 @@ def _parse_nobroker_card_text(block: str, project_url: str) -> dict | None:
             break
     handover = "Ready to move" if status == "ready_to_move" else ""
     return {
-        "id": re.sub(r"[^a-zA-Z0-9]", "", project_url)[-14:] or str(hash(block) % 10**10),
+        "id": project_url.translate(_ID_STRIP_TABLE)[-14:] or str(hash(block) % 10**10),
         "source": "nobroker",
         "status": status,
         "name": name[:200],
@@ -706,7 +1383,8 @@ def _parse_nobroker_card_text(block: str, project_url: str) -> dict | None:
         "locality": locality[:100] if locality else "",
         "price_min_lakhs": price_min,
         "price_max_lakhs": price_max,
-        "price_display": _format_price_display(price_min, price_max) or ("" if (price_min is not None or price_max is not None) else ""),
+        "price_display": "" if price_min is None and price_max is None
+        else _format_price_display(price_min, price_max),
         "handover": handover,
         "handover_year": None if status == "ready_to_move" else None,
         "bhk": bhk,
@@ -714,18 +1392,46 @@ def _parse_nobroker_card_text(block: str, project_url: str) -> dict | None:
     }
 
 
+# Nav/filter link labels that masquerade as project names on listing pages
+_JUNK_LINK_NAMES = frozenset({
+    "List", "Map", "Filter your Search", "Reset", "Sort By", "Next >>", "<< Prev",
+})
+
+
+def _nb_lines(elem, cap: int = 500) -> str:
+    """Newline-joined text of an lxml element (the card parser splits on
+    lines). Stops accumulating past cap chars: the card fields all sit in
+    the first few lines, and page-level ancestors would otherwise
+    materialize their entire subtree text just to be sliced away."""
+    parts = []
+    total = 0
+    for t in elem.itertext():
+        t = t.strip()
+        if t:
+            parts.append(t)
+            total += len(t)
+            if total > cap:
+                break
+    return "\n".join(parts)
+
+
 def scrape_nobroker_list(html: str, base_url: str) -> list[dict]:
     """Parse NoBroker new-projects listing HTML and return list of property dicts."""
-    soup = BeautifulSoup(html, "html.parser")
+    try:
+        anchors = lxml_html.fromstring(html).xpath("//a[@href]")
+    except Exception:
+        anchors = []
     results = []
     seen_urls: set[str] = set()
+    sp = urlsplit(base_url)
+    origin = f"{sp.scheme}://{sp.netloc}"
 
     # Find project detail links: nobroker.in/xxx where xxx contains bangalore, not listing/page
-    for a in soup.find_all("a", href=True):
-        href = a.get("href", "")
+    for a in anchors:
+        href = a.get("href") or ""
         if not href.startswith("http") and not href.startswith("/"):
             continue
-        full_url = urljoin(base_url, href).split("?")[0].rstrip("/")
+        full_url = _absolutize(href, origin, base_url).split("?")[0].rstrip("/")
         if "nobroker.in" not in full_url:
             continue
         path = full_url.replace("https://www.nobroker.in/", "").replace("http://www.nobroker.in/", "").strip("/")
@@ -742,18 +1448,16 @@ def scrape_nobroker_list(html: str, base_url: str) -> list[dict]:
         if len(path) < 10:
             continue
         seen_urls.add(full_url)
-        parent = a.find_parent(["article", "div", "section", "li"])
+        # Nearest card-like ancestor; step up once more if its text is too thin
         card_text = ""
-        if parent:
-            card_text = parent.get_text(separator="\n", strip=True) or ""
-            if len(card_text) < 50:
-                parent = parent.find_parent(["article", "div", "section", "li"])
-                if parent:
-                    card_text = parent.get_text(separator="\n", strip=True) or ""
+        for depth, parent in enumerate(_iter_card_ancestors(a)):
+            card_text = _nb_lines(parent)
+            if len(card_text) >= 50 or depth == 1:
+                break
         if not card_text:
-            card_text = a.get_text(separator="\n", strip=True) or ""
-        name_from_link = (a.get_text(strip=True) or "").strip()[:200]
-        if len(name_from_link) > 4 and name_from_link not in ("List", "Map", "Filter your Search", "Reset", "Sort By", "Next >>", "<< Prev"):
+            card_text = _nb_lines(a)
+        name_from_link = "".join(s.strip() for s in a.itertext()).strip()[:200]
+        if len(name_from_link) > 4 and name_from_link not in _JUNK_LINK_NAMES:
             if not card_text or len(card_text) < 20:
                 card_text = name_from_link + "\n" + card_text
         rec = _parse_nobroker_card_text(card_text, full_url)
@@ -761,22 +1465,26 @@ def scrape_nobroker_list(html: str, base_url: str) -> list[dict]:
             rec["name"] = rec["name"] or name_from_link or rec["name"]
             results.append(rec)
 
-    # Dedupe by url
-    seen = set()
-    unique = []
-    for r in results:
-        if r["url"] not in seen:
-            seen.add(r["url"])
-            unique.append(r)
+    # seen_urls already admits each url once, so results needs no second
+    # dedupe pass; the raw fallback merges through the same gate.
+    if len(results) < 5 and len(html) > 3000:
+        # Regex fallback: blocks that look like "Project Name" + "Name, Locality, Bangalore"
+        for r in _nobroker_extract_from_raw(html, base_url):
+            if r["url"] not in seen_urls:
+                seen_urls.add(r["url"])
+                results.append(r)
+    return results
+
 
-    # Regex fallback: find blocks that look like "Project Name" + "Name, Locality, Bangalore"
-    if len(unique) < 5 and len(html) > 3000:
-        fallback = _nobroker_extract_from_raw(html, base_url)
-        for r in fallback:
-            if r["url"] not in seen:
-                seen.add(r["url"])
-                unique.append(r)
-    return unique
+def _page_text(html: str) -> str:
+    """Flatten a detail page to collapsed text: lxml extracts in C and the
+    split/join collapse runs in one pass, instead of two regex walks that
+    each build a page-sized intermediate. Text nodes are joined with spaces
+    so words never merge across tag boundaries."""
+    try:
+        return " ".join(" ".join(lxml_html.fromstring(html).itertext()).split())
+    except Exception:
+        return _RE_WS.sub(" ", _RE_TAG.sub(" ", html))
 
 
 def _parse_nobroker_detail_page(html: str) -> dict:
@@ -784,16 +1492,17 @@ def _parse_nobroker_detail_page(html: str) -> dict:
     out = {}
     if not html or len(html) < 500:
         return out
-    # Strip tags for regex
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text)
+    # Error/interstitial pages never mention the city or a price; two memchr
+    # scans are far cheaper than flattening and parsing the whole page.
+    if "Bangalore" not in html:
+        return out
+    if "₹" not in html and "Rs." not in html and "Cr" not in html:
+        return out
+    text = _page_text(html)
+    text_lc = text.lower()
     # Price: "₹1.42 Cr - ₹2.22 Cr" or "Rs. 1.04 Crores to Rs. 2.07 Crores" or "₹ 1.42 cr - 2.22 cr"
-    for pattern in [
-        r"₹\s*([\d.]+)\s*Cr\s*-\s*₹?\s*([\d.]+)\s*Cr",
-        r"Rs\.\s*([\d.]+)\s*Crores?\s+to\s+Rs\.\s*([\d.]+)\s*Crores?",
-        r"([\d.]+)\s*Crores?\s*-\s*([\d.]+)\s*Crores?",
-    ]:
-        m = re.search(pattern, text, re.I)
+    for pattern in _NB_PRICE_PATTERNS:
+        m = pattern.search(text_lc)
         if m:
             try:
                 low, high = float(m.group(1)), float(m.group(2))
@@ -811,38 +1520,40 @@ def _parse_nobroker_detail_page(html: str) -> dict:
             out["price_max_lakhs"] = pmax
             out["price_display"] = _format_price_display(pmin, pmax)
     # Builder: "By Goyal And Co Hariyana Group" or "## By ..."
-    m = re.search(r"By\s+([A-Za-z][A-Za-z0-9\s&.,'-]{2,80}?)(?:\s+Est\.|\s*$|\.)", text)
+    m = _RE_NB_BY.search(text)
     if m:
         out["builder"] = m.group(1).strip()[:100]
     # Full address: "Near RS Palace ..., Gunjur Village, Varthur Main Road, Bangalore."
-    m = re.search(r"(Near\s+[^,]+,(?:\s*[^,]+,)*\s*[^,]+,\s*Bangalore\.?)", text)
-    if m:
-        addr = m.group(1).strip()
-        if 15 < len(addr) < 200 and "nobroker" not in addr.lower():
-            out["locality"] = addr[:150]
-    if "locality" not in out:
-        m = re.search(r"([A-Za-z][^.]{15,120}?,?\s*(?:Gunjur|Varthur|Whitefield|Sarjapur|Bellandur|Marathahalli)[^.]*?Bangalore\.?)", text)
+    # Both address patterns must end in "Bangalore"; skip them outright when
+    # the page never says it (memchr scan vs two regex passes).
+    if "Bangalore" in text:
+        m = _RE_NB_ADDRESS.search(text)
         if m:
             addr = m.group(1).strip()
-            if "nobroker" not in addr.lower():
+            if 15 < len(addr) < 200 and "nobroker" not in addr.lower():
                 out["locality"] = addr[:150]
-    # Status
-    if "under construction" in text.lower():
+        if "locality" not in out:
+            m = _RE_NB_LOCALITY.search(text)
+            if m:
+                addr = m.group(1).strip()
+                if "nobroker" not in addr.lower():
+                    out["locality"] = addr[:150]
+    # Status + possession ("Possession in February 2030") in one scan
+    saw_uc, saw_rtm, _saw_nl, _completion, possession = _scan_status_possession(text)
+    if saw_uc:
         out["status"] = "under_construction"
-    elif "ready to move" in text.lower() or "ready" in text.lower() and "possession" not in text[max(0, text.lower().find("ready") - 20) : text.lower().find("ready") + 50]:
+    elif saw_rtm or _RE_READY_CONTEXT.search(text_lc):
         out["status"] = "ready_to_move"
-    # Possession: "Possession in February 2030" or "Possession in Dec 2028"
-    m = re.search(r"Possession\s+in\s+([A-Za-z]+\s+\d{4})", text, re.I)
-    if m:
-        out["handover"] = m.group(1).strip()
+    if possession:
+        out["handover"] = possession.strip()
         y = _year_from_possession(out["handover"])
         if y:
             out["handover_year"] = y
-    elif "possession" in text.lower() and "february 2030" in text.lower():
+    elif "possession" in text_lc and "february 2030" in text_lc:
         out["handover"] = "Feb 2030"
         out["handover_year"] = 2030
     # BHK: "2, 2.5, 3 BHK" or "2 BHK - 1260"
-    m = re.search(r"(\d[\d.,\s]*(?:\d+\.?\d*)?)\s*BHK", text)
+    m = _RE_NB_BHK.search(text)
     if m:
         out["bhk"] = m.group(1).strip().replace(" ", "")[:30]
     return out
@@ -853,19 +1564,25 @@ def _parse_99acres_detail_page(html: str, page_url: str) -> dict:
     out = {}
     if not html or len(html) < 500:
         return out
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text)
+    # Same cheap prefilter as the NoBroker parser: skip non-project pages
+    # before paying for text extraction.
+    if "Bangalore" not in html:
+        return out
+    if "₹" not in html and "Rs." not in html and "Cr" not in html:
+        return out
+    text = _page_text(html)
 
     # Name + locality: "Prestige Raintree Park Whitefield, Bangalore" or title "Prestige Raintree Park, Whitefield, Bangalore"
-    m = re.search(r"#\s*([A-Za-z0-9][A-Za-z0-9\s&.\'-]{3,100}?)\s+([A-Za-z][A-Za-z\s]+),\s*Bangalore", text)
-    if m:
-        out["name"] = m.group(1).strip()[:200]
-        out["locality"] = (m.group(2).strip() + ", Bangalore")[:100]
-    if "name" not in out:
-        m = re.search(r"([A-Za-z0-9][A-Za-z0-9\s&.\'-]{3,80}),\s*([A-Za-z][A-Za-z\s]+),\s*Bangalore\s*-\s*Price", text)
-        if m:
-            out["name"] = m.group(1).strip()[:200]
-            out["locality"] = (m.group(2).strip() + ", Bangalore")[:100]
+    name_loc = None
+    for m in _RE_99_NAME_LOC.finditer(text):
+        if m.group("n1"):
+            name_loc = (m.group("n1"), m.group("l1"))
+            break  # heading form wins over any title form
+        if name_loc is None:
+            name_loc = (m.group("n2"), m.group("l2"))
+    if name_loc:
+        out["name"] = name_loc[0].strip()[:200]
+        out["locality"] = (name_loc[1].strip() + ", Bangalore")[:100]
     if "name" not in out and page_url:
         url_name, url_locality = _name_and_locality_from_href("/" + page_url.split("/")[-1])
         if url_name:
@@ -874,38 +1591,33 @@ def _parse_99acres_detail_page(html: str, page_url: str) -> dict:
                 out["locality"] = url_locality
 
     # Builder: "Brought to you by Prestige Group," or "About Prestige Group"
-    m = re.search(r"Brought\s+to\s+you\s+by\s+([A-Za-z][A-Za-z0-9\s&.,\'-]+?)\s*[,.]", text, re.I)
+    m = _RE_99_BROUGHT_BY.search(text)
     if m:
         out["builder"] = m.group(1).strip()[:100]
     if "builder" not in out:
-        m = re.search(r"About\s+([A-Za-z][A-Za-z0-9\s&.,\'-]{2,60}?)\s+The\s+[A-Za-z]", text, re.I)
+        m = _RE_99_ABOUT.search(text)
         if m:
             out["builder"] = m.group(1).strip()[:100]
     if "builder" not in out and out.get("name"):
         out["builder"] = extract_builder_from_title(out["name"])
 
-    # Status: "Under Construction" / "Construction Status"
-    if "under construction" in text.lower():
+    # Status + handover in one scan: "Under Construction", "Completion from
+    # Dec, 2028 onwards", "Possession in Dec 2028"
+    saw_uc, saw_rtm, saw_nl, completion, possession = _scan_status_possession(text)
+    if saw_uc:
         out["status"] = "under_construction"
-    elif "ready to move" in text.lower() or "ready to move in" in text.lower():
+    elif saw_rtm:
         out["status"] = "ready_to_move"
-    elif "new launch" in text.lower():
+    elif saw_nl:
         out["status"] = "new_launch"
-
-    # Handover: "Completion from Dec, 2028 onwards" or "Possession in Dec 2028"
-    m = re.search(r"Completion\s+from\s+([A-Za-z]+),\s*(\d{4})\s+onwards", text, re.I)
-    if m:
-        out["handover"] = f"{m.group(1).strip()[:3]} {m.group(2)}"
-        try:
-            out["handover_year"] = int(m.group(2))
-        except ValueError:
-            pass
-    if "handover" not in out:
-        m = re.search(r"Possession\s+(?:in\s+)?([A-Za-z]+\s+\d{4})", text, re.I)
-        if m:
-            out["handover"] = m.group(1).strip()[:50]
-            out["handover_year"] = _year_from_possession(out["handover"])
-    if "handover" not in out and "ready to move" in text.lower():
+    if completion:
+        month, year = completion
+        out["handover"] = f"{month.strip()[:3]} {year}"
+        out["handover_year"] = int(year)
+    elif possession:
+        out["handover"] = possession.strip()[:50]
+        out["handover_year"] = _year_from_possession(out["handover"])
+    elif saw_rtm:
         out["handover"] = "Ready to move"
 
     # Price: "₹ 1.77 - 5.37 Cr" or "₹1.77 - 5.37 Cr"
@@ -916,11 +1628,11 @@ def _parse_99acres_detail_page(html: str, page_url: str) -> dict:
         out["price_display"] = _format_price_display(pmin, pmax)
 
     # BHK: "1, 2, 3, 4, 5 BHK" or "PRICE RANGE1, 2, 3, 4, 5 BHK"
-    m = re.search(r"(?:PRICE\s*RANGE\s*)?(\d[\d.,\s]*)\s*BHK\s+Apartment", text, re.I)
+    m = _RE_99_BHK_APT.search(text)
     if m:
         out["bhk"] = m.group(1).strip().replace(" ", "")[:30]
     if "bhk" not in out:
-        m = re.search(r"(\d[\d.,\s]+)\s*BHK", text)
+        m = _RE_99_BHK.search(text)
         if m:
             out["bhk"] = m.group(1).strip().replace(" ", "")[:30]
     return out
@@ -958,32 +1670,69 @@ def _enrich_nobroker_from_detail(record: dict) -> None:
 
 
 def _nobroker_extract_from_raw(html: str, base_url: str) -> list[dict]:
-    """Extract project cards from raw HTML using regex (when DOM structure is unclear)."""
+    """Extract project cards from raw HTML when the DOM structure is unclear.
+
+    Walks the parsed tree and matches "Name, Locality, Bangalore, India"
+    only inside individual text nodes, so the name/locality pattern never
+    backtracks across script/style noise the way it did when run over the
+    whole 500 KB page; the raw-regex scan remains as a parse-failure
+    fallback."""
     results = []
-    # Pattern: >Project Name</ then nearby "Project Name, Locality, Bangalore, India"
-    name_loc = re.findall(
-        r"([A-Za-z0-9][A-Za-z0-9\s&\.\'-]{4,120}),\s*([^,<]+),\s*Bangalore\s*,?\s*India",
-        html
-    )
-    for name, locality in name_loc:
+    seen: set[tuple[str, str]] = set()
+
+    def add(name: str, locality: str, block_clean: str) -> None:
         name = name.strip()[:200]
         locality = locality.strip()[:100]
-        slug = _nobroker_slug(name, locality)
-        url = f"{NOBROKER_BASE}/{slug}"
+        if (name, locality) in seen:
+            return
+        seen.add((name, locality))
+        url = f"{NOBROKER_BASE}/{_nobroker_slug(name, locality)}"
+        rec = _parse_nobroker_card_text(
+            name + ", " + locality + ", Bangalore, India\n\n" + block_clean, url
+        )
+        if rec and rec.get("name"):
+            results.append(rec)
+
+    try:
+        tree = lxml_html.fromstring(html)
+    except Exception:
+        tree = None
+    if tree is not None:
+        for node in tree.xpath('//text()[contains(., "Bangalore")]'):
+            m = _RE_NB_NAME_LOC.search(" ".join(node.split()))
+            if not m:
+                continue
+            # Card context: nearest ancestor with enough text for the
+            # price/builder/BHK line scan (mirrors the old +-800 char window)
+            parent = node.getparent()
+            block_clean = ""
+            for _ in range(3):
+                if parent is None:
+                    break
+                block_clean = " ".join(parent.text_content().split())[:900]
+                if len(block_clean) >= 100:
+                    break
+                parent = parent.getparent()
+            add(m.group(1), m.group(2), block_clean)
+        return results
+
+    # Pattern: >Project Name</ then nearby "Project Name, Locality, Bangalore, India"
+    for name, locality in _RE_NB_NAME_LOC.findall(html):
         block = html
-        idx = block.find(name + ",")
+        idx = block.find(name.strip() + ",")
         if idx == -1:
-            idx = block.find(name)
+            idx = block.find(name.strip())
         if idx != -1:
             block = block[max(0, idx - 100):idx + 800]
-        block_clean = re.sub(r"<[^>]+>", " ", block)
-        block_clean = re.sub(r"\s+", " ", block_clean)
-        rec = _parse_nobroker_card_text(name + ", " + locality + ", Bangalore, India\n\n" + block_clean, url)
-        if rec and rec.get("name"):
-            results.append(rec)
+        add(name, locality, _RE_WS.sub(" ", _RE_TAG.sub(" ", block)))
     return results
 
 
+# The same project appears in several status listings; the more specific
+# status should win regardless of scrape order.
+_STATUS_PRIORITY = {"ready_to_move": 3, "under_construction": 2, "new_launch": 1}
+
+
 def run_scraper(
     conn, max_pages_per_category: int | None = None, do_skip_enrich: bool = True
 ) -> None:
@@ -993,69 +1742,126 @@ def run_scraper(
     max_pages = max_pages_per_category if max_pages_per_category is not None else 999
     inserted_this_run = 0
 
+    # url -> priority of the status already written this run; lower-priority
+    # repeats of the same project are redundant inserts and are skipped.
+    written_status: dict[str, int] = {}
+
     def flush_items(items: list[dict], source_label: str) -> None:
         nonlocal inserted_this_run
+        # Pick the best status per url inline (one dict pass) instead of
+        # materializing dedupe_detail_urls' intermediate list, then filter,
+        # verify, and collect in a single walk over the unique records.
+        best: dict[str, dict] = {}
         for p in items:
+            url = p.get("url")
+            if not url:
+                continue
+            cur = best.get(url)
+            if cur is None or (
+                _STATUS_PRIORITY.get(p.get("status"), 0) > _STATUS_PRIORITY.get(cur.get("status"), 0)
+            ):
+                best[url] = p
+        batch = []
+        append = batch.append
+        for url, p in best.items():
+            prio = _STATUS_PRIORITY.get(p.get("status"), 0)
+            if written_status.get(url, -1) >= prio:
+                continue
             if _is_junk_project_name((p.get("name") or "").strip()):
                 continue
             clean = verify_and_clean_property(p)
             if clean:
-                insert_property(conn, clean)
-                inserted_this_run += 1
+                written_status[url] = prio
+                append(clean)
+        insert_properties_bulk(conn, batch)
+        inserted_this_run += len(batch)
 
     # --- 99acres ---
+    print(f"Scraping 99acres first pages: {', '.join(SOURCE_URLS)}")
+    first_pages = fetch_all_sources()
     for status, url in SOURCE_URLS.items():
-        print(f"Scraping 99acres {status}: {url}")
-        html = fetch(url)
+        html = first_pages.get(status)
         if html:
-            items = scrape_99acres_list(html, url, status)
-            print(f"  -> {len(items)} items")
+            items = _scrape_99acres_cached(html, url, status)
+            print(f"  -> {len(items)} {status} items")
             flush_items(items, "99acres")
-        time.sleep(REQUEST_DELAY_SEC)
+    time.sleep(REQUEST_DELAY_SEC)
 
+    # Pagination pages carry their content in plain HTML, so fetch them in
+    # concurrent batches (no Playwright) and stop at the first empty/failed page.
     for status, base_url in SOURCE_URLS.items():
         page = 2
-        while page <= max_pages:
-            page_url = base_url + f"-page-{page}"
-            print(f"Scraping 99acres {status} page {page}: {page_url}")
-            html = fetch(page_url)
-            if not html:
+        done = False
+        while page <= max_pages and not done:
+            batch = [base_url + f"-page-{p}" for p in range(page, min(page + PAGE_FETCH_CONCURRENCY - 1, max_pages) + 1)]
+            print(f"Scraping 99acres {status} pages {page}-{page + len(batch) - 1}")
+            htmls = fetch_pages(batch)
+            # Truncate at the first failed fetch; later pages in the batch are dropped.
+            n_ok = next((i for i, h in enumerate(htmls) if not h), len(htmls))
+            if n_ok < len(htmls):
                 print(f"  -> fetch failed, stopping pagination for {status}")
-                break
-            items = scrape_99acres_list(html, page_url, status)
-            if not items:
-                print(f"  -> 0 items, no more pages for {status}")
-                break
-            print(f"  -> {len(items)} items")
-            flush_items(items, "99acres")
+                done = True
+            pairs = list(zip(batch[:n_ok], htmls[:n_ok]))
+            if len(pairs) >= 2:
+                # Parsing is CPU-bound (lxml + regex); spread a full batch across cores.
+                parsed = _parse_pool().map(
+                    _scrape_99acres_cached,
+                    [h for _, h in pairs],
+                    [u for u, _ in pairs],
+                    [status] * len(pairs),
+                )
+            else:
+                parsed = (_scrape_99acres_cached(h, u, status) for u, h in pairs)
+            for (page_url, _), items in zip(pairs, parsed):
+                if not items:
+                    print(f"  -> 0 items, no more pages for {status}")
+                    done = True
+                    break
+                print(f"  -> {len(items)} items ({page_url})")
+                flush_items(items, "99acres")
+            page += len(batch)
             time.sleep(REQUEST_DELAY_SEC)
-            page += 1
 
     # --- NoBroker new projects in Bangalore ---
     print(f"Scraping NoBroker: {NOBROKER_LISTING_URL}")
     html = fetch_nobroker(NOBROKER_LISTING_URL)
     if html:
-        items = scrape_nobroker_list(html, NOBROKER_BASE)
+        items = _scrape_nobroker_cached(html, NOBROKER_BASE, NOBROKER_LISTING_URL)
         print(f"  -> {len(items)} items")
         flush_items(items, "NoBroker")
     time.sleep(REQUEST_DELAY_SEC)
 
+    # Pagination pages 2+ carry plain HTML like 99acres, so batch them over
+    # aiohttp too instead of one Playwright-probing fetch per page.
     page = 2
-    while page <= max_pages:
-        page_url = NOBROKER_PAGE_URL.format(page=page)
-        print(f"Scraping NoBroker page {page}: {page_url}")
-        html = fetch_nobroker(page_url)
-        if not html:
-            print(f"  -> fetch failed, stopping NoBroker pagination")
-            break
-        items = scrape_nobroker_list(html, NOBROKER_BASE)
-        if not items:
-            print(f"  -> 0 items, no more NoBroker pages")
-            break
-        print(f"  -> {len(items)} items")
-        flush_items(items, "NoBroker")
+    done = False
+    while page <= max_pages and not done:
+        batch = [NOBROKER_PAGE_URL.format(page=p) for p in range(page, min(page + PAGE_FETCH_CONCURRENCY - 1, max_pages) + 1)]
+        print(f"Scraping NoBroker pages {page}-{page + len(batch) - 1}")
+        htmls = fetch_pages(batch)
+        n_ok = next((i for i, h in enumerate(htmls) if not h), len(htmls))
+        if n_ok < len(htmls):
+            print("  -> fetch failed, stopping NoBroker pagination")
+            done = True
+        pairs = list(zip(batch[:n_ok], htmls[:n_ok]))
+        if len(pairs) >= 2:
+            parsed = _parse_pool().map(
+                _scrape_nobroker_cached,
+                [h for _, h in pairs],
+                [NOBROKER_BASE] * len(pairs),
+                [u for u, _ in pairs],
+            )
+        else:
+            parsed = (_scrape_nobroker_cached(h, NOBROKER_BASE, u) for u, h in pairs)
+        for (page_url, _), items in zip(pairs, parsed):
+            if not items:
+                print("  -> 0 items, no more NoBroker pages")
+                done = True
+                break
+            print(f"  -> {len(items)} items ({page_url})")
+            flush_items(items, "NoBroker")
+        page += len(batch)
         time.sleep(REQUEST_DELAY_SEC)
-        page += 1
 
     cur = conn.execute("SELECT COUNT(*) FROM properties")
     total = cur.fetchone()[0]
@@ -1063,52 +1869,62 @@ def run_scraper(
 
     # Enrich from detail pages when --enrich: update DB rows with canonical name, builder, locality, etc.
     if not do_skip_enrich:
-        acres_urls = get_property_urls_by_source(conn, "99acres")
+        # One table scan yields both source groups
+        urls_by_source = get_property_urls_grouped(conn)
+        acres_urls = urls_by_source.get("99acres", [])
         if acres_urls:
             total_a = len(acres_urls)
             print(f"Enriching {total_a} 99acres properties from detail pages...", flush=True)
             failed = 0
-            for i, url in enumerate(acres_urls):
-                n = i + 1
-                print(f"  99acres {n}/{total_a}", flush=True)
-                try:
-                    html = fetch_99acres_detail(url)
-                    if html:
-                        details = _parse_99acres_detail_page(html, url)
-                        if details:
-                            update_property(conn, url, details)
-                except Exception as e:
-                    failed += 1
-                    if failed <= 3:
-                        print(f"  Skip #{n}: {e}", flush=True)
-                if i < total_a - 1:
+            pending = []
+            for start in range(0, total_a, DETAIL_FETCH_CONCURRENCY):
+                group = acres_urls[start:start + DETAIL_FETCH_CONCURRENCY]
+                print(f"  99acres {start + 1}-{start + len(group)}/{total_a}", flush=True)
+                for url, html in zip(group, fetch_99acres_detail_many(group)):
+                    try:
+                        if html:
+                            details = _parse_99acres_detail_page(html, url)
+                            if details:
+                                pending.append((url, details))
+                                if len(pending) >= 20:
+                                    update_properties_bulk(conn, pending)
+                                    pending = []
+                    except Exception as e:
+                        failed += 1
+                        if failed <= 3:
+                            print(f"  Skip {url}: {e}", flush=True)
+                if start + DETAIL_FETCH_CONCURRENCY < total_a:
                     time.sleep(1)
+            update_properties_bulk(conn, pending)
             if failed:
                 print(f"  Skipped {failed} 99acres detail pages.", flush=True)
             print("  99acres done.", flush=True)
 
-        nobroker_urls = get_property_urls_by_source(conn, "nobroker")
+        nobroker_urls = urls_by_source.get("nobroker", [])
         if nobroker_urls:
             total_nb = len(nobroker_urls)
             print(f"Enriching {total_nb} NoBroker properties from detail pages...", flush=True)
             failed = 0
-            for i, url in enumerate(nobroker_urls):
-                n = i + 1
-                print(f"  NoBroker {n}/{total_nb} ", end="", flush=True)
-                try:
-                    html = fetch_nobroker_detail(url)
-                    if html:
-                        details = _parse_nobroker_detail_page(html)
-                        if details:
-                            update_property(conn, url, details)
-                    print("ok", flush=True)
-                except Exception as e:
-                    failed += 1
-                    print("skip", flush=True)
-                    if failed <= 3:
-                        print(f"    ({str(e)[:80]})", flush=True)
-                if i < total_nb - 1:
+            pending = []
+            for start in range(0, total_nb, DETAIL_FETCH_CONCURRENCY):
+                group = nobroker_urls[start:start + DETAIL_FETCH_CONCURRENCY]
+                print(f"  NoBroker {start + 1}-{start + len(group)}/{total_nb}", flush=True)
+                for url, html in zip(group, fetch_nobroker_detail_many(group)):
+                    try:
+                        if html:
+                            details = _parse_nobroker_detail_page(html)
+                            if details:
+                                pending.append((url, details))
+                                if len(pending) >= 20:
+                                    update_properties_bulk(conn, pending)
+                                    pending = []
+                    except Exception as e:
+                        failed += 1
+                        if failed <= 3:
+                            print(f"    ({str(e)[:80]})", flush=True)
+                if start + DETAIL_FETCH_CONCURRENCY < total_nb:
                     time.sleep(1)
+            update_properties_bulk(conn, pending)
             if failed:
                 print(f"  Skipped {failed} detail pages.", flush=True)
             print("  Done.", flush=True)
@@ -1197,11 +2013,33 @@ def ensure_sample_data(properties: list[dict]) -> list[dict]:
     ]
 
 
+def write_output(records: list[dict], pretty: bool = False) -> None:
+    """Serialize records to OUTPUT_JSON atomically (tmp file + os.replace).
+
+    A crash mid-write leaves the previous export intact instead of a
+    truncated file the Next.js viewer would choke on. Output is compact by
+    default (the viewer reads it programmatically); pass pretty for an
+    indented file worth eyeballing.
+    """
+    OUTPUT_JSON.parent.mkdir(parents=True, exist_ok=True)
+    tmp = OUTPUT_JSON.with_suffix(".json.tmp")
+    if orjson is not None:
+        opts = orjson.OPT_INDENT_2 if pretty else 0
+        tmp.write_bytes(orjson.dumps(records, option=opts))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            if pretty:
+                json.dump(records, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(records, f, separators=(",", ":"), ensure_ascii=False)
+    os.replace(tmp, OUTPUT_JSON)
+
+
 def main():
-    import json
     quick = "--quick" in sys.argv or "-q" in sys.argv
     do_clear = "--clear" in sys.argv or "-c" in sys.argv
     do_export_json = "--export-json" in sys.argv
+    pretty_json = "--pretty" in sys.argv
     do_skip_enrich = "--enrich" not in sys.argv  # default: don't enrich (use --enrich to fetch detail pages)
     max_pages = None
     for i, arg in enumerate(sys.argv):
@@ -1247,9 +2085,7 @@ def main():
         rows = cur.fetchall()
         data = [property_row_to_dict(row) for row in rows]
         conn.close()
-        OUTPUT_JSON.parent.mkdir(parents=True, exist_ok=True)
-        with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_output(data, pretty=pretty_json)
         print(f"Exported {len(data)} properties to {OUTPUT_JSON}")
 
 
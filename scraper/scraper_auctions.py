@@ -4,9 +4,23 @@ Stores each record in SQLite as soon as it's fetched (no large in-memory list).
 Optional: export to public/auctions.json for legacy viewer.
 """
 
+import atexit
+import gzip
+import hashlib
+import json
+import os
 import re
 import sys
+import threading
 import time
+from dataclasses import asdict, dataclass
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from pathlib import Path
 from urllib.parse import urljoin
 
@@ -15,8 +29,25 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 import requests
 from bs4 import BeautifulSoup
-
-from db import get_connection, init_schema, insert_auction
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: orjson serializes the auctions.json export in C when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from db import auction_row_to_dict, get_connection, init_schema, insert_auction
+
+# lxml's C parser is 5-10x faster than the pure-Python html.parser; fall
+# back so the scraper still runs in minimal environments without it.
+try:
+    from lxml import html as lxml_html
+    BS_PARSER = "lxml"
+except ImportError:
+    lxml_html = None
+    BS_PARSER = "html.parser"
 
 # --- Config ---
 # Fetch from filtered search: residential, Bengaluru, Karnataka (~3,887 listings, ~324 pages)
@@ -24,31 +55,240 @@ BASE_URL = "https://www.eauctionsindia.com"
 # URL pattern: /search/{page}?category=residential&city=bengaluru&state=karnataka
 SEARCH_BASE = "https://www.eauctionsindia.com/search"
 SEARCH_PARAMS = "category=residential&city=bengaluru&state=karnataka"
+OUTPUT_JSON = Path(__file__).resolve().parent.parent / "public" / "auctions.json"
 REQUEST_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-IN,en;q=0.9",
 }
-REQUEST_DELAY_SEC = 1.5
 REQUEST_TIMEOUT = 25
 MAX_LISTING_PAGES = 324   # residential Bengaluru has ~324 pages
 MAX_DETAIL_PAGES = 5000   # fetch all property details
+DETAIL_WORKERS = 8        # concurrent detail-page fetches
+TARGET_QPS = 5.0          # global politeness cap shared by all workers
+
+# One pooled session for the whole run: connections are reused across the
+# ~5k detail fetches instead of a TCP+TLS handshake per request. Pool size
+# tracks the worker count — one warm socket per worker — and pool_block
+# makes a worker wait for a pooled socket rather than open a throwaway
+# connection past the cap.
+SESSION = requests.Session()
+SESSION.headers.update(REQUEST_HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=DETAIL_WORKERS,
+    pool_maxsize=DETAIL_WORKERS,
+    pool_block=True,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Token-bucket style limiter: each caller reserves the next slot under the
+# lock, then sleeps outside it, so the fleet of workers never exceeds
+# TARGET_QPS in aggregate (the old per-call time.sleep(1.5) throttled each
+# worker independently and would have multiplied with the pool size).
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def _throttle() -> None:
+    global _next_request_at
+    with _rate_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + 1.0 / TARGET_QPS
+    if wait > 0:
+        time.sleep(wait)
+
+
+MAX_BODY_BYTES = 1_048_576  # 1 MB cap; the labels we parse sit well within it
+
+
+def _read_capped(r) -> str | None:
+    """Read at most MAX_BODY_BYTES from a streamed response; None for non-HTML.
+
+    Bounds memory against pathological pages and stops transferring bytes
+    we would truncate anyway.
+    """
+    ctype = r.headers.get("Content-Type", "")
+    if ctype and "html" not in ctype:
+        return None
+    content = r.raw.read(MAX_BODY_BYTES, decode_content=True)
+    return content.decode(r.encoding or "utf-8", errors="replace")
 
 
 def fetch(url: str) -> str | None:
+    _throttle()
     try:
-        r = requests.get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
-        r.raise_for_status()
-        return r.text
+        r = SESSION.get(url, timeout=REQUEST_TIMEOUT, stream=True)
+        try:
+            r.raise_for_status()
+            return _read_capped(r)
+        finally:
+            r.close()
     except Exception as e:
         print(f"  Fetch error: {e}")
         return None
 
 
+# On-disk detail-page cache with HTTP revalidation. Auction pages barely
+# change between runs: we keep the last body plus its ETag/Last-Modified and
+# send If-None-Match / If-Modified-Since next time, so an unchanged page
+# costs a 304 header round-trip instead of a full download. Same layout as
+# scraper.py's cache (already gitignored).
+_CACHE_DIR = Path(__file__).resolve().parent / ".scrape_cache"
+
+# Bump whenever parse_detail_page logic changes, so stale parsed-record
+# cache entries are ignored.
+PARSER_VERSION = 1
+
+
+def _cache_load(url: str) -> tuple[str | None, dict]:
+    key = hashlib.sha1(url.encode()).hexdigest()
+    try:
+        meta = json.loads((_CACHE_DIR / f"{key}.meta.json").read_text())
+        html = gzip.decompress((_CACHE_DIR / f"{key}.html.gz").read_bytes()).decode("utf-8")
+        return html, meta
+    except Exception:
+        return None, {}
+
+
+def _cache_store(url: str, html: str, headers) -> None:
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        key = hashlib.sha1(url.encode()).hexdigest()
+        (_CACHE_DIR / f"{key}.html.gz").write_bytes(gzip.compress(html.encode("utf-8")))
+        (_CACHE_DIR / f"{key}.meta.json").write_text(json.dumps({
+            "url": url,
+            "fetched_at": time.time(),
+            "etag": headers.get("ETag", ""),
+            "last_modified": headers.get("Last-Modified", ""),
+        }))
+    except Exception:
+        pass  # cache is best-effort; never fail a fetch over it
+
+
+def _parsed_cache_load(url: str, html_digest: str) -> dict | None:
+    path = _CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.parsed.json"
+    try:
+        data = json.loads(path.read_text())
+        if data["parser_version"] == PARSER_VERSION and data["html_sha1"] == html_digest:
+            return data["record"]
+    except Exception:
+        pass
+    return None
+
+
+def _parsed_cache_store(url: str, html_digest: str, record: dict) -> None:
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.parsed.json"
+        path.write_text(json.dumps(
+            {"parser_version": PARSER_VERSION, "html_sha1": html_digest, "record": record}
+        ))
+    except Exception:
+        pass
+
+
+def fetch_detail(url: str) -> str | None:
+    """fetch(), but revalidating against the on-disk copy via conditional GET."""
+    cached_html, meta = _cache_load(url)
+    headers = {}
+    if cached_html is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    _throttle()
+    try:
+        r = SESSION.get(url, headers=headers or None, timeout=REQUEST_TIMEOUT, stream=True)
+        try:
+            if r.status_code == 304 and cached_html is not None:
+                return cached_html
+            r.raise_for_status()
+            html = _read_capped(r)
+        finally:
+            r.close()
+        if html:
+            _cache_store(url, html, r.headers)
+        return html
+    except Exception as e:
+        print(f"  Fetch error: {e}")
+        return cached_html  # stale copy beats nothing when the server flakes
+
+
+# Patterns compiled once at import: the detail parser fires ~20 of them per
+# page, and 5000 pages x 20 lookups through re's internal cache adds up.
+_RE_PROP_ID = re.compile(r"/properties/(\d+)")
+# Deletion table for amount cleanup: one translate pass drops separators and
+# the currency sign where chained str.replace calls each allocated a copy.
+_AMOUNT_STRIP_TABLE = {ord(","): None, ord("₹"): None}
+
+# One fused amount pattern: a number with a Cr/Lakh unit, or a bare rupee
+# figure. A single scan replaces the old four sequential searches (the
+# separate Crore pass was fully shadowed by the Cr one).
+_RE_PRICE_AMOUNT = re.compile(
+    r"([\d.]+)\s*(?:(?P<cr>Cr(?:ore)?)|(?P<lakh>Lakh|Lac|L\b))|(?P<plain>[\d,]+(?:\.\d{2})?)", re.I
+)
+_RE_RUPEE = re.compile(r"₹\s*([\d,]+(?:\.\d{2})?)")
+_RE_SQFT = re.compile(r"(\d[\d,.]*)\s*(?:sq\.?\s*ft|sqft|sft)", re.I)
+_RE_CARPET = re.compile(r"(?:carpet|built-up|super)\s*[:\s]*(\d[\d,.]*)\s*sq", re.I)
+_RE_RESERVE = re.compile(r"Reserve\s*Price\s*[:\s]*₹\s*([\d,]+(?:\.\d{2})?)", re.I)
+_RE_PRICE_NEAR = re.compile(
+    r"(?:reserve\s*price|value|amount)\s*[:\s]*[Rr]s\.?\s*[\d,.]+\s*(?:Lakh|Lac|Cr|Crore)?", re.I
+)
+_RE_EMD = re.compile(r"EMD\s*[:\s]*₹\s*([\d,]+(?:\.\d{2})?)", re.I)
+_RE_EMD_LONG = re.compile(r"Earnest\s*Money\s*Deposit\s*[:\s]*₹\s*([\d,]+(?:\.\d{2})?)", re.I)
+_RE_BANK_NAME = re.compile(
+    r"Bank\s*Name\s*[:\s]*([A-Za-z][A-Za-z0-9\s&.,'-]{2,80}?)(?:\s*Reserve|\s*EMD|\s*Branch|$)", re.I
+)
+# Known lenders for the fallback bank scan. (keyword, lowered) pairs so the
+# earliest-hit str.find pass over the lowered page text needs no regex
+# alternation; ties at the same offset resolve in tuple order, matching the
+# old alternation's leftmost-alternative rule.
+_BANK_KEYWORDS = tuple((kw, kw.lower()) for kw in (
+    "Axis Bank", "SBI", "HDFC", "ICICI", "PNB", "BOB", "Canara", "Union Bank",
+    "Bank of Baroda", "State Bank", "DCB Bank", "Ujjivan", "PNB Housing",
+))
+_RE_BRANCH = re.compile(r"Branch\s*Name\s*[:\s]*([^\n]{2,120}?)(?:\s*Service|\s*Contact|$)", re.I)
+_RE_CONTACT = re.compile(
+    r"contact\s+(Mr\.?\s*[A-Za-z][A-Za-z\s.]{1,40}?)\s*\(?\s*Mobile\s*No\.?\s*[\s:]*([\d\s-]{10,15})", re.I
+)
+_RE_CONTACT_ANY = re.compile(r"(?:contact|mobile|phone)[\s:]*([^\n]{5,80})", re.I)
+_RE_PHONE = re.compile(r"(\+?91[\s-]?\d{5}[\s-]?\d{5})")
+_RE_DT = re.compile(r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}\s*[AP]M)", re.I)
+_RE_AUCTION_END = re.compile(r"(?:end|closing)\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", re.I)
+# Nav/title phrases the description block starts after (see parse_detail_page)
+_DESC_ANCHORS = ("Auction ID", "Reserve Price", "Share", "Login", "Register")
+_RE_DESC_CLASS = re.compile(r"description|content|detail|body", re.I)
+_RE_ADDR = re.compile(r"(?:address|location|situated at|property at)[\s:]*([^.]{15,200})", re.I)
+
+
+def _ws(s: str) -> str:
+    """Collapse runs of whitespace to single spaces (strips ends too)."""
+    return " ".join(s.split())
+
+
 def extract_property_ids_from_html(html: str) -> list[str]:
     """Find all /properties/<id> links in HTML."""
+    # XPath over anchor hrefs only, instead of regexing the full page
+    # (most of which is <script>/markup noise the listing links never sit in).
+    if lxml_html is not None:
+        try:
+            hrefs = lxml_html.fromstring(html).xpath("//a[contains(@href,'/properties/')]/@href")
+        except Exception:
+            hrefs = None
+        if hrefs is not None:
+            ids: list[str] = []
+            seen: set[str] = set()
+            for h in hrefs:
+                m = _RE_PROP_ID.search(h)
+                if m and m.group(1) not in seen:
+                    seen.add(m.group(1))
+                    ids.append(m.group(1))
+            return ids
     ids = []
-    for m in re.finditer(r"/properties/(\d+)", html):
+    for m in _RE_PROP_ID.finditer(html):
         ids.append(m.group(1))
     return list(dict.fromkeys(ids))  # preserve order, dedupe
 
@@ -57,30 +297,33 @@ def parse_price_lakhs(text: str) -> float | None:
     """Parse reserve price / value into lakhs. Handles Rs. 45.5 Lakh, ₹ 1.2 Cr, ₹36,90,000.00 etc."""
     if not text:
         return None
-    raw = text.replace(",", "").replace("₹", "").replace("Rs.", "").strip()
-    m = re.search(r"([\d.]+)\s*Cr", raw, re.I)
-    if m:
-        try:
-            return float(m.group(1)) * 100
-        except ValueError:
-            pass
-    m = re.search(r"([\d.]+)\s*(?:Lakh|Lac|L)\b", raw, re.I)
-    if m:
+    raw = text.translate(_AMOUNT_STRIP_TABLE).replace("Rs.", "").strip()
+    # Collect the first hit of each form, then dispatch by priority
+    # (Cr > Lakh > bare rupees) to keep the old four-pass semantics.
+    cr = lakh = plain = None
+    for m in _RE_PRICE_AMOUNT.finditer(raw):
+        if m.group("cr"):
+            cr = m.group(1)
+            break  # top priority; nothing later can outrank it
+        if m.group("lakh"):
+            if lakh is None:
+                lakh = m.group(1)
+        elif plain is None:
+            plain = m.group("plain")
+    if cr is not None:
         try:
-            return float(m.group(1))
+            return float(cr) * 100
         except ValueError:
             pass
-    m = re.search(r"([\d.]+)\s*(?:Crore|Cr)", raw, re.I)
-    if m:
+    if lakh is not None:
         try:
-            return float(m.group(1)) * 100
+            return float(lakh)
         except ValueError:
             pass
     # Indian format: ₹36,90,000.00 -> 36.9 lakhs
-    m = re.search(r"[\d,]+(?:\.\d{2})?", raw)
-    if m:
+    if plain is not None:
         try:
-            num = float(m.group(0).replace(",", ""))
+            num = float(plain)  # commas already dropped from raw
             return num / 100_000  # paise to lakhs if needed; value is in rupees so /100000 = lakhs
         except ValueError:
             pass
@@ -89,11 +332,11 @@ def parse_price_lakhs(text: str) -> float | None:
 
 def parse_rupee_amount(text: str) -> tuple[str, float | None]:
     """Find first ₹ amount in text; return (raw_display, lakhs). E.g. ₹36,90,000.00 -> ('₹36,90,000.00', 36.9)."""
-    m = re.search(r"₹\s*([\d,]+(?:\.\d{2})?)", text)
+    m = _RE_RUPEE.search(text)
     if not m:
         return "", None
     raw = m.group(0).strip()
-    num_str = m.group(1).replace(",", "")
+    num_str = m.group(1).translate(_AMOUNT_STRIP_TABLE)
     try:
         rupees = float(num_str)
         lakhs = rupees / 100_000
@@ -106,31 +349,115 @@ def parse_sqft(text: str) -> str | None:
     """Extract sq ft / carpet area."""
     if not text:
         return None
-    m = re.search(r"(\d[\d,.]*)\s*(?:sq\.?\s*ft|sqft|sft)", text, re.I)
+    m = _RE_SQFT.search(text)
     if m:
         return m.group(1).strip()
-    m = re.search(r"(?:carpet|built-up|super)\s*[:\s]*(\d[\d,.]*)\s*sq", text, re.I)
+    m = _RE_CARPET.search(text)
     if m:
         return m.group(1).strip()
     return None
 
 
-def parse_detail_page(html: str, url: str, prop_id: str) -> dict | None:
+def _anchored_search(text_flat: str, text_lc: str, anchor: str, pattern):
+    """Run a label-anchored pattern only if its literal anchor is present.
+
+    The find on the lowered text is the gate; on a hit the regex starts at
+    that offset instead of rescanning the page from the top.
+    """
+    pos = text_lc.find(anchor)
+    return pattern.search(text_flat, pos) if pos != -1 else None
+
+
+def _heading_texts(tree, soup) -> list[str]:
+    """All h1/h2 texts, gathered in one DOM pass (lxml when available)."""
+    if tree is not None:
+        return ["".join(s.strip() for s in h.itertext()) for h in tree.xpath("//h1|//h2")]
+    return [(tag.get_text(strip=True) or "") for tag in soup.find_all(["h1", "h2"])]
+
+
+def _description_texts(tree, soup):
+    """Candidate description blocks (div/section/p with a descriptive class)."""
+    if tree is not None:
+        return (
+            " ".join("".join(el.itertext()).split())
+            for el in tree.xpath("//div[@class]|//section[@class]|//p[@class]")
+            if _RE_DESC_CLASS.search(el.get("class"))
+        )
+    return (
+        " ".join((tag.get_text(separator=" ", strip=True) or "").split())
+        for tag in soup.find_all(["div", "section", "p"], class_=_RE_DESC_CLASS)
+    )
+
+
+@dataclass(slots=True)
+class AuctionRecord:
+    """One parsed auction detail page.
+
+    Slots collapse the 20-field per-record dict into a fixed-size array,
+    which matters with thousands of records in flight between the parse
+    pool and the insert loop.
+    """
+    id: str
+    name: str
+    description: str
+    price_display: str
+    price_lakhs: float | None
+    emd_display: str
+    emd_lakhs: float | None
+    sq_ft: str | None
+    bank_name: str
+    branch_name: str
+    contact: str
+    contact_person: str
+    contact_mobile: str
+    address: str
+    url: str
+    auction_start: str
+    auction_end: str
+    auction_datetime: str
+    category: str
+    source: str = "eauctionsindia"
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def parse_detail_page(html: str, url: str, prop_id: str) -> AuctionRecord | None:
     """Extract title, reserve price, EMD, bank, branch, contact, description, etc. from detail page."""
-    soup = BeautifulSoup(html, "html.parser")
-    text = soup.get_text(separator=" ", strip=True) or ""
-    text_flat = re.sub(r"\s+", " ", text)
+    # One lxml tree serves every DOM query below; soup is only the fallback
+    # for environments without lxml.
+    tree = None
+    if lxml_html is not None:
+        try:
+            tree = lxml_html.fromstring(html)
+        except Exception:
+            tree = None
+    soup = None if tree is not None else BeautifulSoup(html, BS_PARSER)
+    # str.split() with no args is a C-level tokenizer that strips and
+    # collapses all whitespace in one pass — no regex sub, no intermediate
+    # full-page string. itertext (not text_content) keeps words from
+    # adjacent tags from running together.
+    if tree is not None:
+        text_flat = " ".join(" ".join(tree.itertext()).split())
+    else:
+        text_flat = " ".join((soup.get_text(separator=" ") or "").split())
+    # Lowered once: the label gates below (and category/bank scans) search
+    # this instead of lowering per check. str.find on a literal is far
+    # cheaper than firing the case-insensitive regexes unconditionally, and
+    # a hit gives the regex a start offset so it never rescans the prefix.
+    text_lc = text_flat.lower()
 
     # --- Title: full property title e.g. "Axis Bank Non-Agricultural Land Auction in Anekal, Bengaluru" ---
     name = ""
-    for tag in soup.find_all(["h1", "h2"]):
-        t = (tag.get_text(strip=True) or "").strip()
+    headings = _heading_texts(tree, soup)
+    for t in headings:
+        t = t.strip()
         if len(t) > 10 and len(t) < 250 and ("auction" in t.lower() or "bank" in t.lower() or "bengaluru" in t.lower()):
             name = t[:250]
             break
     if not name:
-        for tag in soup.find_all(["h1", "h2"]):
-            t = (tag.get_text(strip=True) or "").strip()
+        for t in headings:
+            t = t.strip()
             if len(t) > 5 and len(t) < 250:
                 name = t[:250]
                 break
@@ -140,11 +467,11 @@ def parse_detail_page(html: str, url: str, prop_id: str) -> dict | None:
     # --- Reserve Price: "Reserve Price : ₹36,90,000.00" ---
     price_display = ""
     price_lakhs = None
-    reserve_m = re.search(r"Reserve\s*Price\s*[:\s]*₹\s*([\d,]+(?:\.\d{2})?)", text_flat, re.I)
+    reserve_m = _anchored_search(text_flat, text_lc, "reserve price", _RE_RESERVE)
     if reserve_m:
         price_display, price_lakhs = parse_rupee_amount(reserve_m.group(0))
     if not price_display:
-        for s in re.finditer(r"(?:reserve\s*price|value|amount)\s*[:\s]*[Rr]s\.?\s*[\d,.]+\s*(?:Lakh|Lac|Cr|Crore)?", text_flat, re.I):
+        for s in _RE_PRICE_NEAR.finditer(text_flat):
             chunk = text_flat[max(0, s.start() - 10) : s.end() + 60]
             price_lakhs = parse_price_lakhs(chunk)
             if price_lakhs is not None:
@@ -154,54 +481,57 @@ def parse_detail_page(html: str, url: str, prop_id: str) -> dict | None:
     # --- EMD (Earnest Money Deposit) ---
     emd_display = ""
     emd_lakhs = None
-    emd_m = re.search(r"EMD\s*[:\s]*₹\s*([\d,]+(?:\.\d{2})?)", text_flat, re.I)
+    emd_m = _anchored_search(text_flat, text_lc, "emd", _RE_EMD)
     if not emd_m:
-        emd_m = re.search(r"Earnest\s*Money\s*Deposit\s*[:\s]*₹\s*([\d,]+(?:\.\d{2})?)", text_flat, re.I)
+        emd_m = _anchored_search(text_flat, text_lc, "earnest money", _RE_EMD_LONG)
     if emd_m:
         emd_display, emd_lakhs = parse_rupee_amount(emd_m.group(0))
 
     # --- Bank Name (from "Bank Name" or "Bank Details" section) ---
     bank_name = ""
-    bank_m = re.search(r"Bank\s*Name\s*[:\s]*([A-Za-z][A-Za-z0-9\s&.,'-]{2,80}?)(?:\s*Reserve|\s*EMD|\s*Branch|$)", text_flat, re.I)
+    bank_m = _anchored_search(text_flat, text_lc, "bank name", _RE_BANK_NAME)
     if bank_m:
-        bank_name = re.sub(r"\s+", " ", bank_m.group(1).strip())[:120]
+        bank_name = _ws(bank_m.group(1))[:120]
     if not bank_name:
-        for m in re.finditer(r"(Axis Bank|SBI|HDFC|ICICI|PNB|BOB|Canara|Union Bank|Bank of Baroda|State Bank|DCB Bank|Ujjivan|PNB Housing)", text_flat, re.I):
-            bank_name = m.group(1).strip()[:100]
-            break
+        best_pos = -1
+        for kw, kw_lc in _BANK_KEYWORDS:
+            p = text_lc.find(kw_lc)
+            if p != -1 and (best_pos == -1 or p < best_pos):
+                best_pos = p
+                bank_name = kw
 
     # --- Branch Name ---
     branch_name = ""
-    branch_m = re.search(r"Branch\s*Name\s*[:\s]*([^\n]{2,120}?)(?:\s*Service|\s*Contact|$)", text_flat, re.I)
+    branch_m = _anchored_search(text_flat, text_lc, "branch name", _RE_BRANCH)
     if branch_m:
-        branch_name = re.sub(r"\s+", " ", branch_m.group(1).strip())[:120]
+        branch_name = _ws(branch_m.group(1))[:120]
 
     # --- Contact: "contact Mr. Raghunath (Mobile No. 919886960484)" ---
     contact = ""
     contact_person = ""
     contact_mobile = ""
-    contact_m = re.search(r"contact\s+(Mr\.?\s*[A-Za-z][A-Za-z\s.]{1,40}?)\s*\(?\s*Mobile\s*No\.?\s*[\s:]*([\d\s-]{10,15})", text_flat, re.I)
+    contact_m = _anchored_search(text_flat, text_lc, "contact", _RE_CONTACT)
     if contact_m:
         contact_person = contact_m.group(1).strip()[:80]
-        contact_mobile = re.sub(r"\s+", "", contact_m.group(2).strip())[:20]
+        contact_mobile = "".join(contact_m.group(2).split())[:20]
         contact = f"{contact_person} (Mobile: {contact_mobile})"
     if not contact:
-        for m in re.finditer(r"(?:contact|mobile|phone)[\s:]*([^\n]{5,80})", text_flat, re.I):
-            contact = re.sub(r"\s+", " ", m.group(1).strip())[:100]
+        for m in _RE_CONTACT_ANY.finditer(text_flat):
+            contact = _ws(m.group(1))[:100]
             break
     if not contact:
-        for m in re.finditer(r"(\+?91[\s-]?\d{5}[\s-]?\d{5})", text_flat):
+        for m in _RE_PHONE.finditer(text_flat):
             contact = m.group(1).strip()[:50]
             break
 
     # --- Auction date & time: "18-02-2025 11:00 AM" ---
     auction_datetime = ""
-    dt_m = re.search(r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\s+\d{1,2}:\d{2}\s*[AP]M)", text_flat, re.I)
+    dt_m = _RE_DT.search(text_flat)
     if dt_m:
         auction_datetime = dt_m.group(1).strip()
     auction_start = auction_datetime
     auction_end = ""
-    for m in re.finditer(r"(?:end|closing)\s*[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", text_flat, re.I):
+    for m in _RE_AUCTION_END.finditer(text_flat):
         auction_end = m.group(1).strip()
         break
 
@@ -209,63 +539,88 @@ def parse_detail_page(html: str, url: str, prop_id: str) -> dict | None:
     description = ""
     bank_details_pos = text_flat.find("Bank Details")
     if bank_details_pos > 100:
-        before_bank = text_flat[:bank_details_pos]
-        # Take a substantial block that looks like description (skip nav/title repetition)
-        parts = re.split(r"\s*(?:Auction ID|Reserve Price|Share|Login|Register)\s*", before_bank, 1)
-        if len(parts) > 1:
-            candidate = parts[-1].strip()
+        # Start after the earliest nav/title anchor (skips header repetition);
+        # pure find/offset arithmetic, so the only copy made is the final
+        # bounded slice rather than split/sub passes over the whole prefix.
+        best = -1
+        skip = 0
+        for kw in _DESC_ANCHORS:
+            p = text_flat.find(kw, 0, bank_details_pos)
+            if p != -1 and (best == -1 or p < best):
+                best = p
+                skip = len(kw)
+        if best != -1:
+            start = best + skip
         else:
-            candidate = before_bank[-4000:] if len(before_bank) > 4000 else before_bank
-        candidate = re.sub(r"\s+", " ", candidate).strip()
+            start = max(0, bank_details_pos - 4000)
+        candidate = text_flat[start : min(bank_details_pos, start + 3100)].strip()
         if len(candidate) > 100:
             description = candidate[:3000]
     if not description:
-        for tag in soup.find_all(["div", "section", "p"], class_=re.compile(r"description|content|detail|body", re.I)):
-            desc_text = (tag.get_text(separator=" ", strip=True) or "").strip()
+        for desc_text in _description_texts(tree, soup):
             if len(desc_text) > 150 and "reserve" not in desc_text.lower()[:50]:
-                description = re.sub(r"\s+", " ", desc_text)[:3000]
+                description = desc_text[:3000]
                 break
 
     sq_ft = parse_sqft(text_flat)
     address = ""
-    for m in re.finditer(r"(?:address|location|situated at|property at)[\s:]*([^.]{15,200})", text_flat, re.I):
+    for m in _RE_ADDR.finditer(text_flat):
         addr = m.group(1).strip()
         if "bengaluru" in addr.lower() or "bangalore" in addr.lower() or len(addr) > 25:
-            address = re.sub(r"\s+", " ", addr)[:250]
+            address = _ws(addr)[:250]
             break
 
+    # Priority order matters (land > plot > commercial); each keyword is one
+    # substring scan of the already-lowered text rather than a fresh
+    # full-page .lower() per check.
+    name_lc = name.lower()
     category = "Residential"
-    if "non-agricultural land" in text_flat.lower() or "land" in name.lower():
+    if "non-agricultural land" in text_lc or "land" in name_lc:
         category = "Land"
-    elif "plot" in text_flat.lower() or "plot" in name.lower():
+    elif "plot" in text_lc or "plot" in name_lc:
         category = "Land"
-    elif "commercial" in text_flat.lower():
+    elif "commercial" in text_lc:
         category = "Commercial"
-    elif "flat" in text_flat.lower() or "apartment" in text_flat.lower():
-        category = "Residential"
-
-    return {
-        "id": prop_id,
-        "name": name,
-        "description": description,
-        "price_display": price_display or "",
-        "price_lakhs": price_lakhs,
-        "emd_display": emd_display,
-        "emd_lakhs": emd_lakhs,
-        "sq_ft": sq_ft,
-        "bank_name": bank_name,
-        "branch_name": branch_name,
-        "contact": contact,
-        "contact_person": contact_person,
-        "contact_mobile": contact_mobile,
-        "address": address,
-        "url": url,
-        "auction_start": auction_start,
-        "auction_end": auction_end,
-        "auction_datetime": auction_datetime,
-        "category": category,
-        "source": "eauctionsindia",
-    }
+
+    return AuctionRecord(
+        id=prop_id,
+        name=name,
+        description=description,
+        price_display=price_display or "",
+        price_lakhs=price_lakhs,
+        emd_display=emd_display,
+        emd_lakhs=emd_lakhs,
+        sq_ft=sq_ft,
+        bank_name=bank_name,
+        branch_name=branch_name,
+        contact=contact,
+        contact_person=contact_person,
+        contact_mobile=contact_mobile,
+        address=address,
+        url=url,
+        auction_start=auction_start,
+        auction_end=auction_end,
+        auction_datetime=auction_datetime,
+        category=category,
+    )
+
+
+def _fetch_detail(prop_id: str) -> tuple[str, str, str | None]:
+    url = f"{BASE_URL}/properties/{prop_id}"
+    return prop_id, url, fetch_detail(url)
+
+
+# With fetching threaded, parsing (lxml + regex) is the CPU-bound stage and
+# the GIL pins it to one core; a lazily started process pool spreads it out.
+_PARSE_POOL = None
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=min(DETAIL_WORKERS, os.cpu_count() or 1))
+        atexit.register(_PARSE_POOL.shutdown)
+    return _PARSE_POOL
 
 
 def run_scraper() -> int:
@@ -282,27 +637,94 @@ def run_scraper() -> int:
             ids = extract_property_ids_from_html(html)
             print(f"  -> {len(ids)} property IDs")
             all_ids.extend(ids)
-        time.sleep(REQUEST_DELAY_SEC)
 
     unique_ids = list(dict.fromkeys(all_ids))[:MAX_DETAIL_PAGES]
     print(f"Total unique property IDs to fetch: {len(unique_ids)} (capped at {MAX_DETAIL_PAGES})")
 
+    # Detail fetches run on a thread pool (pure I/O), parsing on the process
+    # pool (CPU-bound), and the sqlite inserts stay on the main thread (one
+    # writer connection). Fetch futures are consumed in completion order —
+    # ex.map would hold parsed-and-ready pages behind one slow early fetch —
+    # and the submission window is bounded so fetched HTML never piles up
+    # faster than it is handed off.
     count = 0
-    for i, prop_id in enumerate(unique_ids):
-        url = f"{BASE_URL}/properties/{prop_id}"
-        print(f"  [{i+1}/{len(unique_ids)}] {url}")
-        html = fetch(url)
-        if html and len(html) > 1000:
+    done = 0
+    total = len(unique_ids)
+    use_procs = total >= 2  # process-pool startup isn't worth it for one page
+    parse_futs: dict = {}   # parse future -> (url, digest)
+
+    def _record(url: str, digest: str | None, rec: dict | None) -> None:
+        nonlocal count
+        if rec:
+            if digest is not None:
+                _parsed_cache_store(url, digest, rec)
+            insert_auction(conn, rec)
+            count += 1
+
+    def _drain_parsed(block: bool = False) -> None:
+        for fut in list(parse_futs):
+            if block or fut.done():
+                url, digest = parse_futs.pop(fut)
+                rec = fut.result()
+                _record(url, digest, rec.to_dict() if rec else None)
+
+    def _consume(fut) -> None:
+        nonlocal done
+        prop_id, url, html = fut.result()
+        done += 1
+        print(f"  [{done}/{total}] {url}")
+        if not (html and len(html) > 1000):
+            return
+        # Skip reparsing when the HTML is byte-identical to last run.
+        digest = hashlib.sha1(html.encode()).hexdigest()
+        rec = _parsed_cache_load(url, digest)
+        if rec is not None:
+            _record(url, None, rec)
+        elif use_procs:
+            parse_futs[_parse_pool().submit(parse_detail_page, html, url, prop_id)] = (url, digest)
+        else:
             rec = parse_detail_page(html, url, prop_id)
-            if rec:
-                insert_auction(conn, rec)
-                count += 1
-        time.sleep(REQUEST_DELAY_SEC)
+            _record(url, digest, rec.to_dict() if rec else None)
+
+    with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as ex:
+        pending: set = set()
+        for prop_id in unique_ids:
+            pending.add(ex.submit(_fetch_detail, prop_id))
+            if len(pending) >= DETAIL_WORKERS * 4:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    _consume(fut)
+                _drain_parsed()
+        for fut in as_completed(pending):
+            _consume(fut)
+    _drain_parsed(block=True)
     conn.close()
     return count
 
 
+def write_output(records: list[dict], pretty: bool = False) -> None:
+    """Write the legacy-viewer export atomically (tmp file + os.replace).
+
+    Compact bytes via orjson when available; the rename means a crash
+    mid-export never leaves a half-written auctions.json behind.
+    """
+    OUTPUT_JSON.parent.mkdir(parents=True, exist_ok=True)
+    tmp = OUTPUT_JSON.with_suffix(".json.tmp")
+    if orjson is not None:
+        opts = orjson.OPT_INDENT_2 if pretty else 0
+        tmp.write_bytes(orjson.dumps(records, option=opts))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            if pretty:
+                json.dump(records, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(records, f, separators=(",", ":"), ensure_ascii=False)
+    os.replace(tmp, OUTPUT_JSON)
+
+
 def main():
+    do_export_json = "--export-json" in sys.argv
+    pretty_json = "--pretty" in sys.argv
     print("Scraping eauctionsindia.com — residential, Bengaluru, Karnataka...")
     count = run_scraper()
     conn = get_connection()
@@ -334,6 +756,13 @@ def main():
     conn.close()
     print(f"Auctions in DB: {count if count else 1} (stored in SQLite)")
 
+    if do_export_json:
+        conn = get_connection()
+        data = [auction_row_to_dict(row) for row in conn.execute("SELECT * FROM auctions")]
+        conn.close()
+        write_output(data, pretty=pretty_json)
+        print(f"Exported {len(data)} auctions to {OUTPUT_JSON}")
+
 
 if __name__ == "__main__":
     main()